@@ -0,0 +1,139 @@
+import gc
+import time
+import heapq
+import random
+import argparse
+import tracemalloc
+from array import array
+from src.tasks.TimingWheel import TimingWheel
+
+# Recurrence of every simulated reminder, "e10m" by default (the worst common case);
+# longer periods show the cost of idle minutes, when only a few reminders are due
+PERIOD_MINUTES = 10
+
+
+class PollingModel:
+    """
+    The minute loop before the scheduler: every tick scans all fire times for due reminders.
+    Stands in for the per-tick `next_fire_at <= now()` query, held in a flat array.
+    """
+
+    def __init__(self, fire_minutes: array, period: int):
+        self.fire_minutes = fire_minutes
+        self.period = period
+
+    def tick(self, now: int) -> int:
+        fire_minutes = self.fire_minutes
+        due = [index for index, minute in enumerate(fire_minutes) if minute <= now]
+        for index in due:
+            fire_minutes[index] = now + self.period
+        return len(due)
+
+
+class HeapModel:
+    """The min-heap scheduler: (fire minute, id) entries plus the valid fire time per id."""
+
+    def __init__(self, fire_minutes: array, period: int):
+        self.period = period
+        self.fire_times = dict(enumerate(fire_minutes))
+        self.heap = [(minute, index) for index, minute in self.fire_times.items()]
+        heapq.heapify(self.heap)
+
+    def tick(self, now: int) -> int:
+        due = []
+        while self.heap and self.heap[0][0] <= now:
+            minute, index = heapq.heappop(self.heap)
+            if self.fire_times.get(index) == minute:
+                due.append(index)
+        for index in due:
+            self.fire_times[index] = now + self.period
+            heapq.heappush(self.heap, (now + self.period, index))
+        return len(due)
+
+
+class WheelModel:
+    """The timing wheel scheduler."""
+
+    def __init__(self, fire_minutes: array, period: int, start: int):
+        self.period = period
+        self.wheel = TimingWheel(start)
+        for index, minute in enumerate(fire_minutes):
+            self.wheel.schedule(index, minute)
+
+    def tick(self, now: int) -> int:
+        due = self.wheel.advance(now)
+        for index in due:
+            self.wheel.schedule(index, now + self.period)
+        return len(due)
+
+
+def measure(name: str, build, size: int, start: int, ticks: int):
+    """Build a model, then report its memory and the average cost of one minute tick."""
+    gc.collect()
+    tracemalloc.start()
+    began = time.perf_counter()
+    model = build()
+    build_seconds = time.perf_counter() - began
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    fired = 0
+    began = time.perf_counter()
+    for minute in range(start + 1, start + ticks + 1):
+        fired += model.tick(minute)
+    tick_ms = (time.perf_counter() - began) / ticks * 1000
+
+    print(
+        f"{name:<8} {size:>10,} reminders | build {build_seconds:7.2f} s"
+        f" | memory {memory / size:6.1f} B/reminder ({memory / 2**20:8.1f} MiB)"
+        f" | tick {tick_ms:9.3f} ms | fired {fired:,}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the polling loop, the heap and the timing wheel schedulers."
+    )
+    parser.add_argument(
+        "--sizes",
+        default="100000,1000000",
+        help="comma separated reminder counts, e.g. 100000,1000000,10000000",
+    )
+    parser.add_argument(
+        "--ticks", type=int, default=30, help="simulated minutes per model"
+    )
+    parser.add_argument(
+        "--period",
+        type=int,
+        default=PERIOD_MINUTES,
+        help="recurrence of every reminder in minutes (10 = e10m)",
+    )
+    parser.add_argument(
+        "--models",
+        default="polling,heap,wheel",
+        help="comma separated subset of polling,heap,wheel",
+    )
+    args = parser.parse_args()
+
+    print(
+        "Build times include tracemalloc overhead; polling memory excludes the table itself.\n"
+    )
+    random.seed(0)
+    start = int(time.time() // 60)
+    for size in (int(size) for size in args.sizes.split(",")):
+        # Spread first occurrences over one period, so every tick fires about size/period
+        fire_minutes = array(
+            "q", (start + random.randint(1, args.period) for _ in range(size))
+        )
+        builders = {
+            "polling": lambda: PollingModel(array("q", fire_minutes), args.period),
+            "heap": lambda: HeapModel(fire_minutes, args.period),
+            "wheel": lambda: WheelModel(fire_minutes, args.period, start),
+        }
+        for name in args.models.split(","):
+            measure(name, builders[name], size, start, args.ticks)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
 import discord
 from discord.ext import commands
+import src.database.PostgreSQLDB as psqldb
+from src.database.Migrator import Migrator
+from src.tasks import changeFeedTask, leaderTask
 
 
 class Eida(commands.Bot):
@@ -10,6 +13,13 @@ class Eida(commands.Bot):
         Called after bot login but before on_ready event.
         Perfect timing for loading cogs without blocking the ready event.
         """
+        # Open the shared database pool before any cog can issue a query
+        await psqldb.open_pool()
+        # Bring the schema up to date before anything relies on its tables or indexes
+        await Migrator.migrate()
+        # Every process listens, so edits made through another instance reach local caches
+        changeFeedTask.listen_for_changes.start()
+
         # Define all cogs that provide the bot's core functionality
         extensions = ["configCog", "dashboardCog", "helpCog", "reminderCog"]
 
@@ -17,6 +27,14 @@ class Eida(commands.Bot):
         for extension in extensions:
             await self.load_extension(f"src.cogs.{extension}")
 
+    async def close(self):
+        """Stop the background tasks, then release database connections once the bot disconnects."""
+        await super().close()
+        # The dispatcher still needs the pool to hand its leases back
+        await leaderTask.stop_election()
+        changeFeedTask.listen_for_changes.cancel()
+        await psqldb.close_pool()
+
 
 # Create bot instance with all intents for full Discord API access
 # Command prefix "!" maintained for hybrid command compatibility
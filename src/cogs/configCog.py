@@ -41,6 +41,20 @@ class Config(commands.Cog):
                 description="You need to create an account!\nPlease use **/c**.",
             ),
         }
+        self.embeds_group_dms = {
+            "enabled": discord.Embed(
+                title="✅ Grouped Reminders",
+                description="Reminders due at the same time will be sent in a single message.",
+            ),
+            "disabled": discord.Embed(
+                title="✅ Grouped Reminders",
+                description="Each reminder will be sent in its own message.",
+            ),
+            "error": discord.Embed(
+                title="❌ Grouped Reminders",
+                description="You need to create an account!\nPlease use **/c**.",
+            ),
+        }
 
     @app_commands.command(
         name="c", description="Create your personal reminder account."
@@ -50,7 +64,7 @@ class Config(commands.Cog):
         Initialize user account for reminder system access.
         """
         try:
-            success = AccountDAO.add_account(interaction.user.id)
+            success = await AccountDAO.add_account(interaction.user.id)
             if success:
                 await interaction.response.send_message(
                     embed=self.embeds_create_account["success"], ephemeral=True
@@ -72,7 +86,7 @@ class Config(commands.Cog):
         """
         Configure user timezone for accurate reminder scheduling.
         """
-        if AccountDAO.account_exists(interaction.user.id):
+        if await AccountDAO.account_exists(interaction.user.id):
             await interaction.response.send_message(
                 embed=self.embeds_set_timezone["url"], view=SetzView(), ephemeral=True
             )
@@ -81,6 +95,20 @@ class Config(commands.Cog):
                 embed=self.embeds_set_timezone["error"], ephemeral=True
             )
 
+    @app_commands.command(
+        name="groupdms",
+        description="Bundle reminders due at the same time into a single message.",
+    )
+    async def set_group_dms(self, interaction: discord.Interaction, enabled: bool):
+        """
+        Toggle whether simultaneous reminders are delivered as one DM.
+        """
+        if await AccountDAO.set_group_dms(interaction.user.id, enabled):
+            embed = self.embeds_group_dms["enabled" if enabled else "disabled"]
+        else:
+            embed = self.embeds_group_dms["error"]
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
 
 async def setup(bot):
     """Standard Discord.py cog setup function for bot registration"""
@@ -4,6 +4,7 @@ from discord.ext import commands
 from src.views.dashboardView import DashboardView
 from src.database.AccountDAO import AccountDAO
 from src.database.ReminderDAO import ReminderDAO
+from src.cogs.reminderCog import reminder_name_autocomplete
 
 
 class Dashboard(commands.Cog):
@@ -30,7 +31,7 @@ class Dashboard(commands.Cog):
         Display paginated reminder dashboard with optional filtering.
         Three modes: all reminders, active only, or inactive only.
         """
-        if not AccountDAO.account_exists(interaction.user.id):
+        if not await AccountDAO.account_exists(interaction.user.id):
             await interaction.response.send_message(
                 embed=self.embeds_no_account, ephemeral=True
             )
@@ -41,7 +42,7 @@ class Dashboard(commands.Cog):
             case None:
                 # Show all reminders regardless of status
                 dashboard_view = DashboardView(interaction.user.id)
-                content, current, total = dashboard_view.get_current_page_info()
+                content, current, total = await dashboard_view.get_current_page_info()
 
                 embed = discord.Embed(
                     title=f"{interaction.user.name}", description=content
@@ -54,7 +55,7 @@ class Dashboard(commands.Cog):
             case "active":
                 # Filter to show only active reminders
                 dashboard_view = DashboardView(interaction.user.id, True)
-                content, current, total = dashboard_view.get_current_page_info()
+                content, current, total = await dashboard_view.get_current_page_info()
 
                 embed = discord.Embed(
                     title=f"{interaction.user.name}", description=content
@@ -67,7 +68,7 @@ class Dashboard(commands.Cog):
             case "inactive":
                 # Filter to show only inactive reminders
                 dashboard_view = DashboardView(interaction.user.id, False)
-                content, current, total = dashboard_view.get_current_page_info()
+                content, current, total = await dashboard_view.get_current_page_info()
 
                 embed = discord.Embed(
                     title=f"{interaction.user.name}", description=content
@@ -79,18 +80,19 @@ class Dashboard(commands.Cog):
                 )
 
     @app_commands.command(name="showrm", description="Show a specific reminder.")
+    @app_commands.autocomplete(reminder_name=reminder_name_autocomplete)
     async def show_reminder(self, interaction: discord.Interaction, reminder_name: str):
         """
         Display detailed information about a specific reminder.
         Shows all reminder properties in human-readable format.
         """
-        if not AccountDAO.account_exists(interaction.user.id):
+        if not await AccountDAO.account_exists(interaction.user.id):
             await interaction.response.send_message(
                 embed=self.embeds_no_account, ephemeral=True
             )
             return
 
-        reminder = ReminderDAO.reminder_exists(interaction.user.id, reminder_name)
+        reminder = await ReminderDAO.reminder_exists(interaction.user.id, reminder_name)
         if not reminder:
             await interaction.response.send_message(
                 embed=self.embeds_no_reminder, ephemeral=True
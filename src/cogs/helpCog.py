@@ -44,7 +44,8 @@ class Help(commands.Cog):
             name="👤 Account Management",
             value=(
                 "`/c` - Create account\n"
-                "`/settimezone {TIMEZONE}` - Set your timezone"
+                "`/settimezone {TIMEZONE}` - Set your timezone\n"
+                "`/groupdms {ENABLED}` - Bundle simultaneous reminders"
             ),
             inline=True, 
         )
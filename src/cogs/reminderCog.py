@@ -7,15 +7,25 @@ from src.database.AccountDAO import AccountDAO
 from src.database.ReminderDAO import ReminderDAO
 from src.modals.setmsgModal import SetMsgModal
 from src.models.Reminder import Reminder
-from datetime import datetime
+from src.models.dto import MutationOutcome
+from src.models.Account import Account
 
 logger = logging.getLogger(__name__)
 
 
+async def reminder_name_autocomplete(
+    interaction: discord.Interaction, current: str
+) -> list[app_commands.Choice[str]]:
+    """Suggest the user's reminder names, served from the reminder snapshot cache."""
+    names = await ReminderDAO.search_reminder_names(interaction.user.id, current)
+    return [app_commands.Choice(name=name, value=name) for name in names]
+
+
 class ReminderCog(commands.Cog):
     """
     Core reminder management commands with consistent validation patterns.
-    All commands follow: account check → reminder existence check → validation → database operation.
+    Edit commands validate their input, then run one statement that checks the account
+    and the reminder while applying the change; its outcome picks the reply.
     """
 
     def __init__(self, bot):
@@ -65,6 +75,10 @@ class ReminderCog(commands.Cog):
                 title="❌ Reminder Name Update",
                 description="An error occurred while updating the reminder name.",
             ),
+            "conflict": discord.Embed(
+                title="❌ Reminder Name Update",
+                description="You already have a reminder with this name.",
+            ),
             "warning": discord.Embed(
                 title="⚠️ Reminder Name Update",
                 description="Unexpected error occurred. Please try again later.",
@@ -113,6 +127,25 @@ class ReminderCog(commands.Cog):
             ),
         }
 
+    async def send_outcome(
+        self,
+        interaction: discord.Interaction,
+        outcome: MutationOutcome,
+        embeds: dict,
+    ):
+        """Reply to an edit command according to the outcome of its mutation."""
+        if outcome is MutationOutcome.OK:
+            embed = embeds["success"]
+        elif outcome is MutationOutcome.NO_ACCOUNT:
+            embed = self.embeds_no_account
+        elif outcome is MutationOutcome.NO_REMINDER:
+            embed = self.embeds_no_reminder
+        elif outcome is MutationOutcome.CONFLICT:
+            embed = embeds.get("conflict", embeds["error"])
+        else:
+            embed = embeds["error"]
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
     @app_commands.command(
         name="remindme", description="Remind yourself about something later."
     )
@@ -120,27 +153,29 @@ class ReminderCog(commands.Cog):
         """
         Open reminder creation modal after account validation.
         """
-        if not AccountDAO.account_exists(interaction.user.id):
+        account = await AccountDAO.account_exists(interaction.user.id)
+        if not account:
             await interaction.response.send_message(
                 embed=self.embeds_no_account, ephemeral=True
             )
             return
 
-        # Open modal for comprehensive reminder input
-        await interaction.response.send_modal(RemindMeModal())
+        # Open modal for comprehensive reminder input, dated in the user's timezone
+        await interaction.response.send_modal(RemindMeModal(account.timezone))
 
     @app_commands.command(name="setmsg", description="Edit your reminder message.")
+    @app_commands.autocomplete(reminder_name=reminder_name_autocomplete)
     async def set_message(self, interaction: discord.Interaction, reminder_name: str):
         """
         Edit reminder message using modal for multi-line text input.
         """
-        if not AccountDAO.account_exists(interaction.user.id):
+        if not await AccountDAO.account_exists(interaction.user.id):
             await interaction.response.send_message(
                 embed=self.embeds_no_account, ephemeral=True
             )
             return
 
-        if not ReminderDAO.reminder_exists(interaction.user.id, reminder_name):
+        if not await ReminderDAO.reminder_exists(interaction.user.id, reminder_name):
             await interaction.response.send_message(
                 embed=self.embeds_no_reminder, ephemeral=True
             )
@@ -150,24 +185,13 @@ class ReminderCog(commands.Cog):
         await interaction.response.send_modal(SetMsgModal(reminder_name))
 
     @app_commands.command(name="settime", description="Set the time for a reminder.")
+    @app_commands.autocomplete(reminder_name=reminder_name_autocomplete)
     async def set_time(
         self, interaction: discord.Interaction, reminder_name: str, time: str
     ):
         """
         Update reminder time with validation.
         """
-        if not AccountDAO.account_exists(interaction.user.id):
-            await interaction.response.send_message(
-                embed=self.embeds_no_account, ephemeral=True
-            )
-            return
-
-        if not ReminderDAO.reminder_exists(interaction.user.id, reminder_name):
-            await interaction.response.send_message(
-                embed=self.embeds_no_reminder, ephemeral=True
-            )
-            return
-
         if not Reminder.validate_time(time):
             await interaction.response.send_message(
                 "Invalid time format. Please use HH:MM format.", ephemeral=True
@@ -175,17 +199,10 @@ class ReminderCog(commands.Cog):
             return
 
         try:
-            success = ReminderDAO.set_reminder_time(
+            outcome = await ReminderDAO.set_reminder_time(
                 interaction.user.id, reminder_name, time
             )
-            if success:
-                await interaction.response.send_message(
-                    embed=self.embeds_settime["success"], ephemeral=True
-                )
-            else:
-                await interaction.response.send_message(
-                    embed=self.embeds_settime["error"], ephemeral=True
-                )
+            await self.send_outcome(interaction, outcome, self.embeds_settime)
         except Exception as e:
             await interaction.response.send_message(
                 embed=self.embeds_settime["warning"], ephemeral=True
@@ -193,6 +210,7 @@ class ReminderCog(commands.Cog):
             logger.error(f"Unexpected error occurred while setting reminder time: {e}")
 
     @app_commands.command(name="setdate", description="Set the date for a reminder.")
+    @app_commands.autocomplete(reminder_name=reminder_name_autocomplete)
     async def set_date(
         self, interaction: discord.Interaction, reminder_name: str, date: str = ""
     ):
@@ -200,21 +218,12 @@ class ReminderCog(commands.Cog):
         Update reminder date with optional parameter defaulting to today.
         Empty string convenience allows users to quickly set reminder to today.
         """
-        if not AccountDAO.account_exists(interaction.user.id):
-            await interaction.response.send_message(
-                embed=self.embeds_no_account, ephemeral=True
-            )
-            return
-
-        if not ReminderDAO.reminder_exists(interaction.user.id, reminder_name):
-            await interaction.response.send_message(
-                embed=self.embeds_no_reminder, ephemeral=True
-            )
-            return
-
-        # Auto-fill today's date for user convenience
+        # Auto-fill today's date in the user's timezone for convenience
         if date == "":
-            date = datetime.now().strftime("%d/%m/%Y")
+            account = await AccountDAO.account_exists(interaction.user.id)
+            date = Account.local_now(account.timezone if account else None).strftime(
+                "%d/%m/%Y"
+            )
         if not Reminder.validate_date(date):
             await interaction.response.send_message(
                 "Invalid date format. Please use DD/MM/YYYY format.", ephemeral=True
@@ -222,19 +231,12 @@ class ReminderCog(commands.Cog):
             return
 
         try:
-            success = ReminderDAO.set_reminder_date(
+            outcome = await ReminderDAO.set_reminder_date(
                 interaction.user.id,
                 reminder_name,
                 date,
             )
-            if success:
-                await interaction.response.send_message(
-                    embed=self.embeds_setdate["success"], ephemeral=True
-                )
-            else:
-                await interaction.response.send_message(
-                    embed=self.embeds_setdate["error"], ephemeral=True
-                )
+            await self.send_outcome(interaction, outcome, self.embeds_setdate)
         except Exception as e:
             await interaction.response.send_message(
                 embed=self.embeds_setdate["warning"], ephemeral=True
@@ -242,36 +244,18 @@ class ReminderCog(commands.Cog):
             logger.error(f"Unexpected error occurred while setting reminder date: {e}")
 
     @app_commands.command(name="setname", description="Set the name for a reminder.")
+    @app_commands.autocomplete(reminder_name=reminder_name_autocomplete)
     async def set_name(
         self, interaction: discord.Interaction, reminder_name: str, new_name: str
     ):
         """
         Rename a reminder with unique name constraint validation.
         """
-        if not AccountDAO.account_exists(interaction.user.id):
-            await interaction.response.send_message(
-                embed=self.embeds_no_account, ephemeral=True
-            )
-            return
-
-        if not ReminderDAO.reminder_exists(interaction.user.id, reminder_name):
-            await interaction.response.send_message(
-                embed=self.embeds_no_reminder, ephemeral=True
-            )
-            return
-
         try:
-            success = ReminderDAO.set_reminder_name(
+            outcome = await ReminderDAO.set_reminder_name(
                 interaction.user.id, reminder_name, new_name
             )
-            if success:
-                await interaction.response.send_message(
-                    embed=self.embeds_setname["success"], ephemeral=True
-                )
-            else:
-                await interaction.response.send_message(
-                    embed=self.embeds_setname["error"], ephemeral=True
-                )
+            await self.send_outcome(interaction, outcome, self.embeds_setname)
         except Exception as e:
             await interaction.response.send_message(
                 embed=self.embeds_setname["warning"], ephemeral=True
@@ -281,6 +265,7 @@ class ReminderCog(commands.Cog):
     @app_commands.command(
         name="setintervals", description="Set the intervals for a reminder."
     )
+    @app_commands.autocomplete(reminder_name=reminder_name_autocomplete)
     async def set_intervals(
         self, interaction: discord.Interaction, reminder_name: str, intervals: str
     ):
@@ -288,18 +273,6 @@ class ReminderCog(commands.Cog):
         Update reminder intervals with complex format validation.
         Supports both regular (e10m2h1d) and weekly (w:mon,tue,fri) patterns.
         """
-        if not AccountDAO.account_exists(interaction.user.id):
-            await interaction.response.send_message(
-                embed=self.embeds_no_account, ephemeral=True
-            )
-            return
-
-        if not ReminderDAO.reminder_exists(interaction.user.id, reminder_name):
-            await interaction.response.send_message(
-                embed=self.embeds_no_reminder, ephemeral=True
-            )
-            return
-
         if not Reminder.validate_intervals(intervals):
             await interaction.response.send_message(
                 "Invalid intervals format. Please check your input.", ephemeral=True
@@ -307,17 +280,10 @@ class ReminderCog(commands.Cog):
             return
 
         try:
-            success = ReminderDAO.set_reminder_intervals(
+            outcome = await ReminderDAO.set_reminder_intervals(
                 interaction.user.id, reminder_name, intervals
             )
-            if success:
-                await interaction.response.send_message(
-                    embed=self.embeds_setintervals["success"], ephemeral=True
-                )
-            else:
-                await interaction.response.send_message(
-                    embed=self.embeds_setintervals["error"], ephemeral=True
-                )
+            await self.send_outcome(interaction, outcome, self.embeds_setintervals)
         except Exception as e:
             await interaction.response.send_message(
                 embed=self.embeds_setintervals["warning"], ephemeral=True
@@ -327,34 +293,18 @@ class ReminderCog(commands.Cog):
             )
 
     @app_commands.command(name="delrm", description="Delete a reminder.")
+    @app_commands.autocomplete(reminder_name=reminder_name_autocomplete)
     async def delete_reminder(
         self, interaction: discord.Interaction, reminder_name: str
     ):
         """
         Permanently delete a reminder.
         """
-        if not AccountDAO.account_exists(interaction.user.id):
-            await interaction.response.send_message(
-                embed=self.embeds_no_account, ephemeral=True
-            )
-            return
-
-        if not ReminderDAO.reminder_exists(interaction.user.id, reminder_name):
-            await interaction.response.send_message(
-                embed=self.embeds_no_reminder, ephemeral=True
-            )
-            return
-
         try:
-            success = ReminderDAO.delete_reminder(interaction.user.id, reminder_name)
-            if success:
-                await interaction.response.send_message(
-                    embed=self.embeds_delrm["success"], ephemeral=True
-                )
-            else:
-                await interaction.response.send_message(
-                    embed=self.embeds_delrm["error"], ephemeral=True
-                )
+            outcome = await ReminderDAO.delete_reminder(
+                interaction.user.id, reminder_name
+            )
+            await self.send_outcome(interaction, outcome, self.embeds_delrm)
         except Exception as e:
             await interaction.response.send_message(
                 embed=self.embeds_delrm["warning"], ephemeral=True
@@ -365,6 +315,7 @@ class ReminderCog(commands.Cog):
         name="togglerm",
         description="Toggle a reminder on/off (activate or deactivate).",
     )
+    @app_commands.autocomplete(reminder_name=reminder_name_autocomplete)
     async def set_reminder_status(
         self, interaction: discord.Interaction, reminder_name: str
     ):
@@ -372,30 +323,11 @@ class ReminderCog(commands.Cog):
         Toggle reminder active status between enabled/disabled states.
         Provides quick way to temporarily pause reminders without deletion.
         """
-        if not AccountDAO.account_exists(interaction.user.id):
-            await interaction.response.send_message(
-                embed=self.embeds_no_account, ephemeral=True
-            )
-            return
-
-        if not ReminderDAO.reminder_exists(interaction.user.id, reminder_name):
-            await interaction.response.send_message(
-                embed=self.embeds_no_reminder, ephemeral=True
-            )
-            return
-
         try:
-            success = ReminderDAO.toggle_reminder_status(
+            outcome = await ReminderDAO.toggle_reminder_status(
                 interaction.user.id, reminder_name
             )
-            if success:
-                await interaction.response.send_message(
-                    embed=self.embeds_togglerm["success"], ephemeral=True
-                )
-            else:
-                await interaction.response.send_message(
-                    embed=self.embeds_togglerm["error"], ephemeral=True
-                )
+            await self.send_outcome(interaction, outcome, self.embeds_togglerm)
         except Exception as e:
             await interaction.response.send_message(
                 embed=self.embeds_togglerm["warning"], ephemeral=True
@@ -0,0 +1,21 @@
+-- Baseline schema, formerly src/data/create.sql.
+-- IF NOT EXISTS lets databases created from the old script adopt the migration history.
+CREATE TABLE IF NOT EXISTS Account(
+   user_id BIGINT PRIMARY KEY,
+   timezone VARCHAR(40)
+);
+
+CREATE TABLE IF NOT EXISTS Reminder(
+   reminder_id INT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+   r_name VARCHAR(50) NOT NULL,
+   r_message VARCHAR(1024) NOT NULL,
+   r_time TIME NOT NULL,
+   r_date DATE DEFAULT CURRENT_DATE,
+   r_intervals VARCHAR(30),
+   is_active BOOLEAN DEFAULT TRUE,
+   user_id BIGINT NOT NULL,
+   -- A user cannot create two reminder with the same name.
+   -- Its unique index also serves every (user_id, r_name) lookup and the unfiltered dashboard ORDER BY r_name.
+   CONSTRAINT reminder_name_unique UNIQUE(user_id, r_name),
+   CONSTRAINT fk_user FOREIGN KEY(user_id) REFERENCES Account(user_id)
+);
@@ -0,0 +1,10 @@
+-- Due reminder scan: is_active = TRUE AND r_date = today AND r_time <= now.
+-- Partial index keeps inactive reminders out of the scheduler's path entirely.
+CREATE INDEX IF NOT EXISTS reminder_due_idx
+   ON Reminder (r_date, r_time)
+   WHERE is_active;
+
+-- Filtered dashboard: user_id = ? AND is_active = ? ORDER BY r_name.
+-- Equality columns first so pages are read in r_name order without a sort.
+CREATE INDEX IF NOT EXISTS reminder_user_activity_name_idx
+   ON Reminder (user_id, is_active, r_name);
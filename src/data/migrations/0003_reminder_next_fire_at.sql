@@ -0,0 +1,17 @@
+-- Single UTC instant at which a reminder fires next; NULL once a one-time reminder has been sent.
+-- r_date/r_time stay as the user-facing wall-clock values and are interpreted in the session time zone.
+ALTER TABLE Reminder ADD COLUMN IF NOT EXISTS next_fire_at TIMESTAMPTZ;
+
+UPDATE Reminder
+   SET next_fire_at = CASE
+      -- One-time reminders already in the past were sent by the old date/time scan
+      WHEN COALESCE(r_intervals, '') = '' AND (r_date + r_time)::timestamptz <= now() THEN NULL
+      ELSE (r_date + r_time)::timestamptz
+   END
+ WHERE next_fire_at IS NULL;
+
+-- Due scan becomes a single range: is_active AND next_fire_at <= now()
+DROP INDEX IF EXISTS reminder_due_idx;
+CREATE INDEX IF NOT EXISTS reminder_next_fire_idx
+   ON Reminder (next_fire_at)
+   WHERE is_active;
@@ -0,0 +1,45 @@
+-- Server-side twin of ReminderDAO._calculate_next_occurrence, so due reminders can be
+-- claimed and rescheduled by a single UPDATE ... RETURNING.
+-- Works on wall-clock timestamps (r_date + r_time); returns NULL when there is no next occurrence.
+CREATE OR REPLACE FUNCTION reminder_next_occurrence(current_at TIMESTAMP, intervals TEXT)
+RETURNS TIMESTAMP
+LANGUAGE plpgsql
+IMMUTABLE
+AS $$
+DECLARE
+   weekdays INT[];
+   candidate TIMESTAMP;
+BEGIN
+   -- Weekly pattern: w:mon,tue,fri or w:* (ISO weekdays, Monday = 1)
+   IF intervals LIKE 'w:%' THEN
+      IF intervals = 'w:*' THEN
+         weekdays := ARRAY[1, 2, 3, 4, 5, 6, 7];
+      ELSE
+         SELECT array_agg(array_position(
+                   ARRAY['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun'], lower(trim(day))))
+           INTO weekdays
+           FROM unnest(string_to_array(substr(intervals, 3), ',')) AS day;
+      END IF;
+
+      -- Next matching weekday within the following 7 days, keeping the original time
+      FOR i IN 1..7 LOOP
+         candidate := current_at + make_interval(days => i);
+         IF extract(isodow FROM candidate)::INT = ANY(weekdays) THEN
+            RETURN candidate;
+         END IF;
+      END LOOP;
+      RETURN NULL;
+
+   -- Regular pattern: e10m2h1d (every 10 minutes, 2 hours, 1 day)
+   ELSIF intervals LIKE 'e%' THEN
+      RETURN current_at + make_interval(
+         days => COALESCE((regexp_match(intervals, '(\d+)d'))[1]::INT, 0),
+         hours => COALESCE((regexp_match(intervals, '(\d+)h'))[1]::INT, 0),
+         mins => COALESCE((regexp_match(intervals, '(\d+)m'))[1]::INT, 0)
+      );
+   END IF;
+
+   -- One-time reminder (NULL or empty intervals)
+   RETURN NULL;
+END;
+$$;
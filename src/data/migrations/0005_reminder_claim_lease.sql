@@ -0,0 +1,4 @@
+-- Lease taken by a dispatcher between claiming a due reminder and rescheduling it.
+-- An expired lease (crashed or stalled worker) makes the reminder claimable again.
+ALTER TABLE Reminder ADD COLUMN IF NOT EXISTS claimed_by VARCHAR(64);
+ALTER TABLE Reminder ADD COLUMN IF NOT EXISTS claim_expires_at TIMESTAMPTZ;
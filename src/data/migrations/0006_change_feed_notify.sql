@@ -0,0 +1,60 @@
+-- Change feed: every user-visible write to Reminder or Account is published on the
+-- eida_changes channel so other bot processes can drop stale cache entries and reschedule.
+-- NOTIFY is transactional, listeners only hear about committed changes and nothing on rollback.
+CREATE OR REPLACE FUNCTION notify_reminder_change() RETURNS trigger AS $$
+DECLARE
+    changed Reminder;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        changed := OLD;
+    ELSE
+        changed := NEW;
+    END IF;
+
+    PERFORM pg_notify('eida_changes', json_build_object(
+        'table', 'reminder',
+        'kind', lower(TG_OP),
+        'user_id', changed.user_id,
+        'reminder_id', changed.reminder_id,
+        'name', changed.r_name,
+        -- Lets a dispatcher tell whether the change makes the reminder due right away
+        'next_fire_at', CASE WHEN TG_OP <> 'DELETE' AND changed.is_active THEN changed.next_fire_at END
+    )::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION notify_account_change() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('eida_changes', json_build_object(
+        'table', 'account',
+        'kind', lower(TG_OP),
+        'user_id', CASE WHEN TG_OP = 'DELETE' THEN OLD.user_id ELSE NEW.user_id END
+    )::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS reminder_change_notify ON Reminder;
+CREATE TRIGGER reminder_change_notify
+    AFTER INSERT OR DELETE ON Reminder
+    FOR EACH ROW EXECUTE FUNCTION notify_reminder_change();
+
+-- Claiming a reminder only touches the lease columns and stays silent
+DROP TRIGGER IF EXISTS reminder_update_notify ON Reminder;
+CREATE TRIGGER reminder_update_notify
+    AFTER UPDATE ON Reminder
+    FOR EACH ROW
+    WHEN (OLD.r_name IS DISTINCT FROM NEW.r_name
+        OR OLD.r_message IS DISTINCT FROM NEW.r_message
+        OR OLD.r_time IS DISTINCT FROM NEW.r_time
+        OR OLD.r_date IS DISTINCT FROM NEW.r_date
+        OR OLD.r_intervals IS DISTINCT FROM NEW.r_intervals
+        OR OLD.is_active IS DISTINCT FROM NEW.is_active
+        OR OLD.next_fire_at IS DISTINCT FROM NEW.next_fire_at)
+    EXECUTE FUNCTION notify_reminder_change();
+
+DROP TRIGGER IF EXISTS account_change_notify ON Account;
+CREATE TRIGGER account_change_notify
+    AFTER INSERT OR DELETE OR UPDATE OF timezone ON Account
+    FOR EACH ROW EXECUTE FUNCTION notify_account_change();
@@ -0,0 +1,4 @@
+-- DM channel of each user, learnt on the first reminder sent to them.
+-- Later reminders are posted straight to it, without resolving the user or opening the channel.
+-- Not watched by the change feed triggers: only the dispatcher reads it.
+ALTER TABLE Account ADD COLUMN IF NOT EXISTS dm_channel_id BIGINT;
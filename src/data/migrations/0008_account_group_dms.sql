@@ -0,0 +1,8 @@
+-- Whether reminders of a user due at the same time are bundled into one DM (on by default).
+ALTER TABLE Account ADD COLUMN IF NOT EXISTS group_dms BOOLEAN NOT NULL DEFAULT TRUE;
+
+-- The dispatcher caches the setting, so toggling it is published like a timezone change
+DROP TRIGGER IF EXISTS account_change_notify ON Account;
+CREATE TRIGGER account_change_notify
+    AFTER INSERT OR DELETE OR UPDATE OF timezone, group_dms ON Account
+    FOR EACH ROW EXECUTE FUNCTION notify_account_change();
@@ -0,0 +1,39 @@
+-- Catch-up after downtime: a recurring reminder is moved straight to its first occurrence
+-- after a given instant instead of one step at a time, and the occurrences it missed are counted.
+-- Both work on wall-clock timestamps like reminder_next_occurrence.
+
+-- First occurrence strictly after `after`, NULL for one-time reminders
+CREATE OR REPLACE FUNCTION reminder_occurrence_after(current_at TIMESTAMP, intervals TEXT, after TIMESTAMP)
+RETURNS TIMESTAMP
+LANGUAGE plpgsql
+IMMUTABLE
+AS $$
+DECLARE
+   candidate TIMESTAMP := current_at;
+BEGIN
+   LOOP
+      candidate := reminder_next_occurrence(candidate, intervals);
+      IF candidate IS NULL OR candidate > after THEN
+         RETURN candidate;
+      END IF;
+   END LOOP;
+END;
+$$;
+
+-- Occurrences from current_at (included) up to `until`, counting at most max_count
+CREATE OR REPLACE FUNCTION reminder_missed_occurrences(current_at TIMESTAMP, intervals TEXT, until TIMESTAMP, max_count INT)
+RETURNS INT
+LANGUAGE plpgsql
+IMMUTABLE
+AS $$
+DECLARE
+   candidate TIMESTAMP := current_at;
+   missed INT := 0;
+BEGIN
+   WHILE candidate IS NOT NULL AND candidate <= until AND missed < max_count LOOP
+      missed := missed + 1;
+      candidate := reminder_next_occurrence(candidate, intervals);
+   END LOOP;
+   RETURN missed;
+END;
+$$;
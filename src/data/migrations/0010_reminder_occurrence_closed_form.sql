@@ -0,0 +1,62 @@
+-- Closed-form reminder_occurrence_after: jumps straight to the first occurrence after `after`
+-- in constant time, instead of stepping through every period missed since current_at.
+-- Server-side twin of ReminderDAO._calculate_occurrence_after.
+CREATE OR REPLACE FUNCTION reminder_occurrence_after(current_at TIMESTAMP, intervals TEXT, after TIMESTAMP)
+RETURNS TIMESTAMP
+LANGUAGE plpgsql
+IMMUTABLE
+AS $$
+DECLARE
+   period INTERVAL;
+   periods BIGINT;
+   mask INT;
+   fire_time TIME;
+   start_date DATE;
+   rotated INT;
+BEGIN
+   -- Weekly pattern: w:mon,tue,fri or w:* (ISO weekdays, bit 0 = Monday)
+   IF intervals LIKE 'w:%' THEN
+      IF intervals = 'w:*' THEN
+         mask := 127;
+      ELSE
+         SELECT COALESCE(bit_or(1 << (array_position(
+                   ARRAY['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun'], lower(trim(day))) - 1)), 0)
+           INTO mask
+           FROM unnest(string_to_array(substr(intervals, 3), ',')) AS day;
+      END IF;
+      IF mask = 0 THEN
+         RETURN NULL;
+      END IF;
+
+      -- Occurrences keep the original time and start the day after current_at
+      fire_time := current_at::time;
+      start_date := current_at::date + 1;
+      IF after::date >= start_date THEN
+         start_date := CASE WHEN after::time < fire_time THEN after::date ELSE after::date + 1 END;
+      END IF;
+
+      -- Rotate the mask (doubled to wrap around the week) so bit 0 is start_date's weekday;
+      -- its lowest set bit is then the number of days to the first matching weekday
+      rotated := ((mask | (mask << 7)) >> (extract(isodow FROM start_date)::INT - 1)) & 127;
+      RETURN start_date + log(2, (rotated & -rotated)::NUMERIC)::INT + fire_time;
+
+   -- Regular pattern: e10m2h1d (every 10 minutes, 2 hours, 1 day)
+   ELSIF intervals LIKE 'e%' THEN
+      period := make_interval(
+         days => COALESCE((regexp_match(intervals, '(\d+)d'))[1]::INT, 0),
+         hours => COALESCE((regexp_match(intervals, '(\d+)h'))[1]::INT, 0),
+         mins => COALESCE((regexp_match(intervals, '(\d+)m'))[1]::INT, 0)
+      );
+      IF period <= interval '0' THEN
+         RETURN NULL;
+      END IF;
+
+      -- Whole periods elapsed up to `after`, plus one to land strictly after it
+      periods := greatest(1, floor(extract(epoch FROM after - current_at) / extract(epoch FROM period)) + 1);
+      RETURN current_at + periods * period;
+   END IF;
+
+   -- One-time reminder (NULL or empty intervals)
+   RETURN NULL;
+END;
+$$;
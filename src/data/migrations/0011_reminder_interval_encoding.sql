@@ -0,0 +1,77 @@
+-- Intervals compiled once at write time, so rescheduling never parses r_intervals again:
+-- interval_seconds holds the period of e10m2h1d patterns, interval_weekdays the 7-bit mask
+-- of w:mon,fri patterns (bit 0 = Monday). Both NULL for one-time reminders.
+-- r_intervals stays as the user-facing text. Written by ReminderDAO through models.Interval.
+ALTER TABLE Reminder ADD COLUMN IF NOT EXISTS interval_seconds INT;
+ALTER TABLE Reminder ADD COLUMN IF NOT EXISTS interval_weekdays SMALLINT;
+
+UPDATE Reminder
+   SET interval_seconds = NULLIF(extract(epoch FROM make_interval(
+          days => COALESCE((regexp_match(r_intervals, '(\d+)d'))[1]::INT, 0),
+          hours => COALESCE((regexp_match(r_intervals, '(\d+)h'))[1]::INT, 0),
+          mins => COALESCE((regexp_match(r_intervals, '(\d+)m'))[1]::INT, 0)
+       ))::INT, 0)
+ WHERE r_intervals LIKE 'e%';
+
+UPDATE Reminder
+   SET interval_weekdays = CASE WHEN r_intervals = 'w:*' THEN 127 ELSE NULLIF((
+          SELECT COALESCE(bit_or(1 << (array_position(
+                    ARRAY['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun'], lower(trim(day))) - 1)), 0)
+            FROM unnest(string_to_array(substr(r_intervals, 3), ',')) AS day
+       ), 0) END
+ WHERE r_intervals LIKE 'w:%';
+
+-- Same as the text variant of 0010, on the compiled columns
+CREATE OR REPLACE FUNCTION reminder_occurrence_after(current_at TIMESTAMP, period_seconds INT, weekdays INT, after TIMESTAMP)
+RETURNS TIMESTAMP
+LANGUAGE plpgsql
+IMMUTABLE
+AS $$
+DECLARE
+   start_date DATE;
+   rotated INT;
+BEGIN
+   IF period_seconds > 0 THEN
+      -- Whole periods elapsed up to `after`, plus one to land strictly after it
+      RETURN current_at + greatest(1, floor(extract(epoch FROM after - current_at) / period_seconds) + 1)
+         * period_seconds * interval '1 second';
+   ELSIF weekdays > 0 THEN
+      -- Occurrences keep the original time and start the day after current_at
+      start_date := current_at::date + 1;
+      IF after::date >= start_date THEN
+         start_date := CASE WHEN after::time < current_at::time THEN after::date ELSE after::date + 1 END;
+      END IF;
+      -- Lowest set bit of the mask rotated to start_date's weekday = days to the next match
+      rotated := ((weekdays | (weekdays << 7)) >> (extract(isodow FROM start_date)::INT - 1)) & 127;
+      RETURN start_date + log(2, (rotated & -rotated)::NUMERIC)::INT + current_at::time;
+   END IF;
+
+   -- One-time reminder
+   RETURN NULL;
+END;
+$$;
+
+-- Occurrences from current_at (included) up to `until`, counting at most max_count
+CREATE OR REPLACE FUNCTION reminder_missed_occurrences(current_at TIMESTAMP, period_seconds INT, weekdays INT, until TIMESTAMP, max_count INT)
+RETURNS INT
+LANGUAGE plpgsql
+IMMUTABLE
+AS $$
+DECLARE
+   candidate TIMESTAMP := current_at;
+   missed INT := 0;
+BEGIN
+   IF current_at > until THEN
+      RETURN 0;
+   ELSIF period_seconds > 0 THEN
+      RETURN least(max_count, floor(extract(epoch FROM until - current_at) / period_seconds) + 1);
+   END IF;
+
+   -- Weekly and one-time reminders, bounded by max_count
+   WHILE candidate IS NOT NULL AND candidate <= until AND missed < max_count LOOP
+      missed := missed + 1;
+      candidate := reminder_occurrence_after(candidate, period_seconds, weekdays, candidate);
+   END LOOP;
+   RETURN missed;
+END;
+$$;
@@ -0,0 +1,43 @@
+-- Reminder dates and times are wall-clock values in the owner's Account.timezone.
+-- next_fire_at becomes the UTC instant of that wall-clock time, so the dispatcher keeps a
+-- single global range query. Accounts without (or with an unknown) timezone keep the
+-- session time zone, as before.
+
+-- Fire instant of a wall-clock time in a timezone; times skipped by a DST change move forward
+CREATE OR REPLACE FUNCTION reminder_fire_at(local_at TIMESTAMP, tz TEXT)
+RETURNS TIMESTAMPTZ
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+   IF COALESCE(tz, '') = '' THEN
+      RETURN local_at::timestamptz;
+   END IF;
+   RETURN local_at AT TIME ZONE tz;
+EXCEPTION WHEN invalid_parameter_value THEN
+   RETURN local_at::timestamptz;
+END;
+$$;
+
+-- Current wall-clock time in a timezone, what recurrences are advanced past
+CREATE OR REPLACE FUNCTION reminder_local_now(tz TEXT)
+RETURNS TIMESTAMP
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+   IF COALESCE(tz, '') = '' THEN
+      RETURN localtimestamp;
+   END IF;
+   RETURN now() AT TIME ZONE tz;
+EXCEPTION WHEN invalid_parameter_value THEN
+   RETURN localtimestamp;
+END;
+$$;
+
+UPDATE Reminder AS r
+   SET next_fire_at = reminder_fire_at(r.r_date + r.r_time, a.timezone)
+  FROM Account AS a
+ WHERE a.user_id = r.user_id
+   AND r.next_fire_at IS NOT NULL
+   AND COALESCE(a.timezone, '') <> '';
@@ -0,0 +1,5 @@
+-- Scheduling reads the compiled interval_seconds/interval_weekdays columns since 0011.
+-- The variants parsing r_intervals text are no longer called by anything.
+DROP FUNCTION IF EXISTS reminder_missed_occurrences(TIMESTAMP, TEXT, TIMESTAMP, INT);
+DROP FUNCTION IF EXISTS reminder_occurrence_after(TIMESTAMP, TEXT, TIMESTAMP);
+DROP FUNCTION IF EXISTS reminder_next_occurrence(TIMESTAMP, TEXT);
@@ -0,0 +1,31 @@
+-- Reminders of accounts without (or with an unknown) timezone are UTC wall-clock times,
+-- in Python and SQL alike, instead of following the session or host time zone.
+CREATE OR REPLACE FUNCTION reminder_fire_at(local_at TIMESTAMP, tz TEXT)
+RETURNS TIMESTAMPTZ
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+   RETURN local_at AT TIME ZONE COALESCE(NULLIF(tz, ''), 'UTC');
+EXCEPTION WHEN invalid_parameter_value THEN
+   RETURN local_at AT TIME ZONE 'UTC';
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION reminder_local_now(tz TEXT)
+RETURNS TIMESTAMP
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+   RETURN now() AT TIME ZONE COALESCE(NULLIF(tz, ''), 'UTC');
+EXCEPTION WHEN invalid_parameter_value THEN
+   RETURN now() AT TIME ZONE 'UTC';
+END;
+$$;
+
+UPDATE Reminder AS r
+   SET next_fire_at = reminder_fire_at(r.r_date + r.r_time, a.timezone)
+  FROM Account AS a
+ WHERE a.user_id = r.user_id
+   AND r.next_fire_at IS NOT NULL;
@@ -0,0 +1,6 @@
+-- Leases held by other workers keep reminders out of the scheduler's wheel until they expire.
+-- Only leased rows are indexed, so finding the earliest expiry never touches the rest.
+CREATE INDEX IF NOT EXISTS reminder_claim_expiry_idx
+   ON Reminder (claim_expires_at)
+   INCLUDE (claimed_by)
+   WHERE claimed_by IS NOT NULL;
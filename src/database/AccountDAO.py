@@ -1,12 +1,32 @@
+import os
 import psycopg
 import logging
-from typing import Optional
+from typing import Dict, Iterable, Optional
 from src.models.Account import Account
+from src.models.dto import DeliveryTarget
 from psycopg.errors import UniqueViolation
 import src.database.PostgreSQLDB as psqldb
+from src.database.TTLCache import TTLCache, MISSING
 
 logger = logging.getLogger(__name__)
 
+# Accounts almost never change, so nearly every command can skip the lookup query.
+# Writes from every process are pushed through the change feed, so entries can live long.
+ACCOUNT_CACHE_SIZE = int(os.getenv("ACCOUNT_CACHE_SIZE", "10000"))
+ACCOUNT_CACHE_TTL = float(os.getenv("ACCOUNT_CACHE_TTL", "3600"))
+# Unknown users are cached for a shorter time since they may register at any moment
+ACCOUNT_CACHE_NEGATIVE_TTL = float(os.getenv("ACCOUNT_CACHE_NEGATIVE_TTL", "60"))
+
+# DM channel ids only change when Discord drops a channel, which the dispatcher notices itself,
+# and grouping changes come through the change feed
+DELIVERY_CACHE_SIZE = int(os.getenv("DELIVERY_CACHE_SIZE", "50000"))
+DELIVERY_CACHE_TTL = float(os.getenv("DELIVERY_CACHE_TTL", "86400"))
+
+# user_id -> Account, or None for users known to have no account
+_account_cache = TTLCache(ACCOUNT_CACHE_SIZE, ACCOUNT_CACHE_TTL)
+# user_id -> DeliveryTarget, or None for users known to have no account
+_delivery_cache = TTLCache(DELIVERY_CACHE_SIZE, DELIVERY_CACHE_TTL)
+
 
 class AccountDAO:
     """
@@ -15,19 +35,14 @@ class AccountDAO:
     """
 
     @staticmethod
-    def add_account(discord_uid: int) -> bool:
+    async def add_account(discord_uid: int) -> bool:
         """Create new account record for Discord user."""
         try:
-            with psycopg.connect(
-                user=psqldb.DBUSER,
-                password=psqldb.DBPASS,
-                host=psqldb.DBHOST,
-                dbname=psqldb.DBNAME,
-            ) as connection:
-                with connection.cursor() as cursor:
+            async with psqldb.pool.connection() as connection:
+                async with connection.cursor() as cursor:
                     try:
                         # Tuple syntax required for single parameter to avoid string iteration
-                        cursor.execute(
+                        await cursor.execute(
                             "INSERT INTO account (user_id) VALUES (%s)", (discord_uid,)
                         )
                     except UniqueViolation as e:
@@ -35,7 +50,11 @@ class AccountDAO:
                         logger.warning(
                             f"Account already exists for user_id={discord_uid}."
                         )
+                        # A cached miss is stale, reload on next lookup
+                        _account_cache.invalidate(discord_uid)
                         return False
+            # Write through so the next command does not re-read the row (or a cached miss)
+            _account_cache.set(discord_uid, Account(discord_uid, None))
             logger.info(f"New account successfully created => user_id={discord_uid}.")
             return True
         except psycopg.DatabaseError as e:
@@ -43,58 +62,181 @@ class AccountDAO:
             return False
 
     @staticmethod
-    def set_timezone(discord_uid: int, timezone: str) -> bool:
+    async def set_timezone(discord_uid: int, timezone: str) -> bool:
         """
         Update user's timezone setting with pre-validation.
+        Every pending reminder of the user gets its fire instant recomputed in the same transaction.
         """
-        # Validate timezone using pytz before database interaction
+        # Validate timezone using zoneinfo before database interaction
         if not Account.is_a_timezone(timezone):
             return False
 
         try:
-            with psycopg.connect(
-                user=psqldb.DBUSER,
-                password=psqldb.DBPASS,
-                host=psqldb.DBHOST,
-                dbname=psqldb.DBNAME,
-            ) as connection:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        "UPDATE account SET timezone = %s WHERE user_id = %s",
-                        (timezone, discord_uid),
-                    )
-            logger.info(f"User timezone updated for user_id={discord_uid}")
+            async with psqldb.pool.connection() as connection:
+                async with connection.transaction():
+                    async with connection.cursor() as cursor:
+                        await cursor.execute(
+                            "UPDATE account SET timezone = %s WHERE user_id = %s",
+                            (timezone, discord_uid),
+                        )
+                        # Check rowcount to verify account exists and was updated
+                        if cursor.rowcount == 0:
+                            logger.warning(
+                                f"No account found to update for user_id={discord_uid}"
+                            )
+                            return False
+                        # Same wall-clock times, new UTC instants; dropping the leases stops an
+                        # in-flight dispatch from rescheduling over them
+                        await cursor.execute(
+                            "UPDATE reminder SET next_fire_at = reminder_fire_at(r_date + r_time, %s),"
+                            " claimed_by = NULL, claim_expires_at = NULL"
+                            " WHERE user_id = %s AND next_fire_at IS NOT NULL",
+                            (timezone, discord_uid),
+                        )
+                        rescheduled = cursor.rowcount
+            _account_cache.set(discord_uid, Account(discord_uid, timezone))
+            logger.info(
+                f"User timezone updated for user_id={discord_uid}, {rescheduled} reminders rescheduled"
+            )
             return True
         except psycopg.DatabaseError as e:
             logger.error(f"Error updating user_id={discord_uid} timezone: {e}")
             return False
 
     @staticmethod
-    def account_exists(discord_uid: int) -> Optional[Account]:
+    async def account_exists(discord_uid: int) -> Optional[Account]:
         """
         Check if account exists and return Account object if found.
         Returns Optional[Account] to handle both existence check and data retrieval.
+        Served from the in-process cache when possible, including cached misses.
         """
+        cached = _account_cache.get(discord_uid)
+        if cached is not MISSING:
+            return cached
+
         try:
-            with psycopg.connect(
-                user=psqldb.DBUSER,
-                password=psqldb.DBPASS,
-                host=psqldb.DBHOST,
-                dbname=psqldb.DBNAME,
-            ) as connection:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        "SELECT * FROM account WHERE user_id = %s", (discord_uid,)
+            async with psqldb.pool.connection() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(
+                        "SELECT user_id, timezone FROM account WHERE user_id = %s",
+                        (discord_uid,),
                     )
-                    result = cursor.fetchone()
+                    result = await cursor.fetchone()
             if result:
                 # Unpack database row into Account model fields
                 user_id, timezone = result
                 logger.info(f"User info retrieved for user_id={discord_uid}")
-                return Account(user_id, timezone)
+                account = Account(user_id, timezone)
+                _account_cache.set(discord_uid, account)
+                return account
             else:
                 logger.info(f"No account found for user_id={discord_uid}")
+                _account_cache.set(discord_uid, None, ACCOUNT_CACHE_NEGATIVE_TTL)
                 return None
         except psycopg.DatabaseError as e:
             logger.error(f"Error getting account for user_id={discord_uid}: {e}")
             return None
+
+    @staticmethod
+    async def get_delivery_targets(
+        discord_uids: Iterable[int],
+    ) -> Dict[int, DeliveryTarget]:
+        """
+        DM channel and grouping setting of the given users, users without account are left out.
+        Served from the in-process cache, the misses are loaded in a single query.
+        """
+        targets = {}
+        missing = []
+        for discord_uid in set(discord_uids):
+            cached = _delivery_cache.get(discord_uid)
+            if cached is MISSING:
+                missing.append(discord_uid)
+            elif cached is not None:
+                targets[discord_uid] = cached
+        if not missing:
+            return targets
+
+        try:
+            async with psqldb.pool.connection() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(
+                        "SELECT user_id, dm_channel_id, group_dms FROM account WHERE user_id = ANY(%s)",
+                        (missing,),
+                    )
+                    result = {
+                        user_id: DeliveryTarget(channel_id, group_dms)
+                        for user_id, channel_id, group_dms in await cursor.fetchall()
+                    }
+            for discord_uid in missing:
+                target = result.get(discord_uid)
+                _delivery_cache.set(discord_uid, target)
+                if target is not None:
+                    targets[discord_uid] = target
+        except psycopg.DatabaseError as e:
+            # Unknown channels are resolved through Discord instead
+            logger.error(f"Error getting delivery targets: {e}")
+        return targets
+
+    @staticmethod
+    async def set_dm_channel(discord_uid: int, channel_id: Optional[int]) -> bool:
+        """Remember a user's DM channel, or forget it (None) once Discord rejected it."""
+        cached = _delivery_cache.get(discord_uid)
+        if cached is not MISSING and cached is not None:
+            _delivery_cache.set(
+                discord_uid, DeliveryTarget(channel_id, cached.group_dms)
+            )
+        try:
+            async with psqldb.pool.connection() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(
+                        "UPDATE account SET dm_channel_id = %s WHERE user_id = %s",
+                        (channel_id, discord_uid),
+                    )
+            return True
+        except psycopg.DatabaseError as e:
+            logger.error(f"Error saving DM channel of user_id={discord_uid}: {e}")
+            return False
+
+    @staticmethod
+    async def set_group_dms(discord_uid: int, enabled: bool) -> bool:
+        """Turn the bundling of simultaneous reminders into one DM on or off."""
+        try:
+            async with psqldb.pool.connection() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(
+                        "UPDATE account SET group_dms = %s WHERE user_id = %s",
+                        (enabled, discord_uid),
+                    )
+                    if cursor.rowcount == 0:
+                        logger.warning(
+                            f"No account found to update for user_id={discord_uid}"
+                        )
+                        return False
+            _delivery_cache.invalidate(discord_uid)
+            logger.info(f"DM grouping set to {enabled} for user_id={discord_uid}")
+            return True
+        except psycopg.DatabaseError as e:
+            logger.error(f"Error updating user_id={discord_uid} DM grouping: {e}")
+            return False
+
+    @staticmethod
+    def invalidate_account(discord_uid: int):
+        """Forget a cached account changed by another process."""
+        _account_cache.invalidate(discord_uid)
+        _delivery_cache.invalidate(discord_uid)
+
+    @staticmethod
+    def clear_cache():
+        """Forget every cached account, used when change events may have been missed."""
+        _account_cache.clear()
+        _delivery_cache.clear()
+
+    @staticmethod
+    def cache_stats() -> dict:
+        """Hit/miss counters of the account cache for monitoring."""
+        return _account_cache.stats()
+
+    @staticmethod
+    def delivery_cache_stats() -> dict:
+        """Hit/miss counters of the delivery target cache for monitoring."""
+        return _delivery_cache.stats()
@@ -0,0 +1,77 @@
+import logging
+from pathlib import Path
+from typing import List, Tuple
+import src.database.PostgreSQLDB as psqldb
+
+logger = logging.getLogger(__name__)
+
+# Versioned SQL files named "<version>_<description>.sql", applied in version order
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "data" / "migrations"
+
+# Arbitrary constant shared by every bot instance so only one of them migrates at a time
+MIGRATION_LOCK_KEY = 4_711_001
+
+
+class Migrator:
+    """
+    Applies pending schema migrations at startup and records them in schema_migrations.
+    Uses static methods to match the DAO classes sharing the same connection pool.
+    """
+
+    @staticmethod
+    def list_migrations() -> List[Tuple[int, str, Path]]:
+        """Discover migration files as (version, name, path) sorted by version."""
+        migrations = []
+        for path in sorted(MIGRATIONS_DIR.glob("*.sql")):
+            version, _, name = path.stem.partition("_")
+            migrations.append((int(version), name, path))
+        return sorted(migrations)
+
+    @staticmethod
+    async def migrate() -> int:
+        """
+        Apply every migration not yet recorded, each in its own transaction.
+        Returns the number of migrations applied by this call.
+        Errors are propagated on purpose: the bot must not start on a half-migrated schema.
+        """
+        applied_count = 0
+        async with psqldb.pool.connection() as connection:
+            async with connection.transaction():
+                async with connection.cursor() as cursor:
+                    # IF NOT EXISTS is not race-free, so creation also happens under the lock
+                    await cursor.execute(
+                        "SELECT pg_advisory_xact_lock(%s)", (MIGRATION_LOCK_KEY,)
+                    )
+                    await cursor.execute(
+                        "CREATE TABLE IF NOT EXISTS schema_migrations ("
+                        " version INT PRIMARY KEY,"
+                        " name VARCHAR(100) NOT NULL,"
+                        " applied_at TIMESTAMPTZ NOT NULL DEFAULT now())"
+                    )
+
+            for version, name, path in Migrator.list_migrations():
+                async with connection.transaction():
+                    async with connection.cursor() as cursor:
+                        # Transaction-scoped lock serializes concurrent instances starting together
+                        await cursor.execute(
+                            "SELECT pg_advisory_xact_lock(%s)", (MIGRATION_LOCK_KEY,)
+                        )
+                        # Re-check under the lock since another instance may have just applied it
+                        await cursor.execute(
+                            "SELECT 1 FROM schema_migrations WHERE version = %s",
+                            (version,),
+                        )
+                        if await cursor.fetchone():
+                            continue
+
+                        # No parameters, so the file may hold several statements
+                        await cursor.execute(path.read_text(encoding="utf-8"))
+                        await cursor.execute(
+                            "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+                            (version, name),
+                        )
+                applied_count += 1
+                logger.info(f"Applied migration {version:04d}_{name}")
+
+        logger.info(f"Database schema up to date ({applied_count} migrations applied)")
+        return applied_count
@@ -1,6 +1,7 @@
 import os
 import logging
 import psycopg
+from psycopg_pool import AsyncConnectionPool
 from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
@@ -12,38 +13,82 @@ DBPASS = os.getenv("PASSWORD")
 DBHOST = os.getenv("HOSTNAME2")
 DBNAME = os.getenv("DBNAME")
 
+# Sessions run in UTC whatever the server or role default is, like reminders of accounts
+# without a timezone, so implicit timestamp casts never depend on where Postgres runs
+CONNECTION_KWARGS = {
+    "user": DBUSER,
+    "password": DBPASS,
+    "host": DBHOST,
+    "dbname": DBNAME,
+    "options": "-c timezone=UTC",
+}
 
-class PostgreSQLDB:
+# Pool sizing: a few warm connections cover normal traffic, the cap protects Postgres during bursts
+POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "2"))
+POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+# Seconds an idle connection above min_size is kept before being closed
+POOL_MAX_IDLE = float(os.getenv("DB_POOL_MAX_IDLE", "300"))
+# Seconds a caller waits for a free connection before giving up
+POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+
+# Process-wide asyncio pool shared by every DAO, opened once at bot startup.
+# Async connections let a slow query suspend only its caller instead of the whole gateway loop.
+# Autocommit: every DAO call is a single statement, so an implicit BEGIN/COMMIT would only add
+# two round trips. Multi-statement work opts in with connection.transaction().
+pool = AsyncConnectionPool(
+    kwargs={**CONNECTION_KWARGS, "autocommit": True},
+    min_size=POOL_MIN_SIZE,
+    max_size=POOL_MAX_SIZE,
+    max_idle=POOL_MAX_IDLE,
+    timeout=POOL_TIMEOUT,
+    # Health check on checkout so a connection dropped by the server is replaced transparently
+    check=AsyncConnectionPool.check_connection,
+    name="eida",
+    open=False,
+)
+
+
+async def open_pool():
+    """Open the shared pool and wait until min_size connections are ready."""
+    await pool.open(wait=True)
+    logger.info(
+        f"Database pool opened (min_size={POOL_MIN_SIZE}, max_size={POOL_MAX_SIZE})"
+    )
+
+
+async def close_pool():
+    """Close every pooled connection, used on bot shutdown."""
+    await pool.close()
+    logger.info("Database pool closed")
+
+
+def pool_stats() -> dict:
     """
-    Database connection wrapper with context manager support.
-    Provides automatic connection cleanup and consistent error handling.
+    Expose pool counters (pool_size, pool_available, requests_waiting, ...)
+    for monitoring connection usage under load.
     """
+    return pool.get_stats()
+
 
-    def __init__(self):
-        self.connection = None
-
-    def connect(self):
-        """Establish database connection with centralized error handling"""
-        try:
-            self.connection = psycopg.connect(
-                user=DBUSER,
-                password=DBPASS,
-                host=DBHOST,
-                dbname=DBNAME,
-            )
-        except psycopg.DatabaseError as e:
-            logger.error(f"Error while connecting to database: {e}")
-
-    def close(self):
-        """Safely close database connection if it exists"""
-        if self.connection:
-            self.connection.close()
-
-    def __enter__(self):
-        """Context manager entry: establish connection and return it for use"""
-        self.connect()
-        return self.connection
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit: ensure connection is always closed"""
-        self.close()
+async def connect_dedicated() -> psycopg.AsyncConnection:
+    """
+    Open an autocommit connection outside the pool for session-scoped state
+    (advisory locks, LISTEN) that must not leak into pooled connections.
+    A process that exits closes its socket and the server ends the session at once. If the
+    host or network vanishes instead, only TCP keepalives notice, and each end needs its own:
+    the client ones let this process detect a dead server, the server-side tcp_keepalives_*
+    settings make Postgres drop the session, and the advisory lock with it, within seconds.
+    """
+    return await psycopg.AsyncConnection.connect(
+        **{
+            **CONNECTION_KWARGS,
+            "options": CONNECTION_KWARGS["options"]
+            + " -c tcp_keepalives_idle=5 -c tcp_keepalives_interval=2"
+            " -c tcp_keepalives_count=3",
+        },
+        autocommit=True,
+        keepalives=1,
+        keepalives_idle=5,
+        keepalives_interval=2,
+        keepalives_count=3,
+    )
@@ -1,42 +1,197 @@
+import os
 import psycopg
 import logging
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 from src.models.Reminder import Reminder
+from src.models.Interval import Interval
 from psycopg.errors import UniqueViolation
 import src.database.PostgreSQLDB as psqldb
-from datetime import datetime, timedelta
-from src.models.dto import ReminderInfo
-import re
+from src.database.TTLCache import TTLCache, MISSING
+from datetime import datetime
+from src.models.dto import ReminderInfo, ReminderPage, MutationOutcome
 
 logger = logging.getLogger(__name__)
 
+# Per-user snapshots of every reminder, serving existence checks, /showrm, dashboard pages
+# and autocomplete without a query. Bounded by user count and estimated bytes.
+REMINDER_CACHE_USERS = int(os.getenv("REMINDER_CACHE_USERS", "1000"))
+REMINDER_CACHE_BYTES = int(os.getenv("REMINDER_CACHE_BYTES", str(32 * 1024 * 1024)))
+# Writes from every process are pushed through the change feed, so snapshots can live long
+REMINDER_CACHE_TTL = float(os.getenv("REMINDER_CACHE_TTL", "3600"))
+# Users with more reminders than this are always read straight from Postgres
+REMINDER_SNAPSHOT_MAX = int(os.getenv("REMINDER_SNAPSHOT_MAX", "500"))
+
+
+def _snapshot_bytes(snapshot: Optional[Dict[str, Reminder]]) -> int:
+    """Rough memory footprint of a snapshot: string payloads plus fixed object overhead."""
+    if not snapshot:
+        return 0
+    return sum(
+        400
+        + len(reminder.reminder_name)
+        + len(reminder.message)
+        + len(reminder.intervals or "")
+        for reminder in snapshot.values()
+    )
+
+
+# Timezone of the account owning the reminder row being written, for reminder_fire_at().
+# Reminder times are wall-clock values in that timezone (migration 0012).
+_OWNER_TIMEZONE = (
+    "(SELECT timezone FROM account WHERE account.user_id = reminder.user_id)"
+)
+
+# Statements of the hot paths, kept here so tests/test_query_plans.py can EXPLAIN exactly
+# what runs. Edits identify their reminder by %(user_id)s and %(name)s.
+
+# SET reads the old row, so the new time is combined explicitly to keep next_fire_at in sync.
+# Dropping the lease stops an in-flight dispatch from rescheduling over the user's edit.
+_SET_TIME_SQL = (
+    "UPDATE reminder SET r_time = %(time)s,"
+    f" next_fire_at = reminder_fire_at(r_date + %(time)s, {_OWNER_TIMEZONE}),"
+    " claimed_by = NULL, claim_expires_at = NULL"
+    " WHERE user_id = %(user_id)s AND r_name = %(name)s"
+)
+_SET_DATE_SQL = (
+    "UPDATE reminder SET r_date = %(date)s,"
+    f" next_fire_at = reminder_fire_at(%(date)s + r_time, {_OWNER_TIMEZONE}),"
+    " claimed_by = NULL, claim_expires_at = NULL"
+    " WHERE user_id = %(user_id)s AND r_name = %(name)s"
+)
+_SET_NAME_SQL = (
+    "UPDATE reminder SET r_name = %(new_name)s"
+    " WHERE user_id = %(user_id)s AND r_name = %(name)s"
+)
+# A sent one-time reminder that just became recurring is re-armed at its next
+# occurrence after now, not at the past date and time it was already sent at
+_SET_INTERVALS_SQL = (
+    "UPDATE reminder SET r_intervals = %(intervals)s,"
+    " interval_seconds = %(seconds)s, interval_weekdays = %(weekdays)s,"
+    " r_date = COALESCE(rearm.next_at::date, r_date),"
+    " r_time = COALESCE(rearm.next_at::time, r_time),"
+    " next_fire_at = COALESCE(next_fire_at, reminder_fire_at(rearm.next_at, rearm.timezone))"
+    " FROM (SELECT reminder_id AS rearm_id, timezone, CASE WHEN next_fire_at IS NULL THEN"
+    " reminder_occurrence_after(r_date + r_time, %(seconds)s, %(weekdays)s,"
+    " reminder_local_now(timezone)) END AS next_at"
+    " FROM reminder JOIN account USING (user_id)"
+    " WHERE user_id = %(user_id)s AND r_name = %(name)s) AS rearm"
+    " WHERE reminder_id = rearm.rearm_id"
+)
+_DELETE_SQL = "DELETE FROM reminder WHERE user_id = %(user_id)s AND r_name = %(name)s"
+_TOGGLE_STATUS_SQL = (
+    "UPDATE reminder SET is_active = NOT is_active"
+    " WHERE user_id = %(user_id)s AND r_name = %(name)s"
+)
+# Wraps one of the edits above. A reminder cannot exist without its account (foreign key),
+# so the account only needs checking when no row matched.
+_MUTATE_REMINDER_SQL = (
+    "WITH target AS ({statement} RETURNING reminder_id)"
+    " SELECT EXISTS (SELECT 1 FROM target),"
+    " EXISTS (SELECT 1 FROM account WHERE user_id = %(user_id)s)"
+)
+
+# Range scan on the partial next_fire_at index
+_FIRE_SCHEDULE_SQL = (
+    "SELECT reminder_id, next_fire_at FROM reminder"
+    " WHERE is_active AND next_fire_at < %(before)s"
+    " AND (%(after)s::timestamptz IS NULL OR next_fire_at >= %(after)s)"
+    " AND (claimed_by = %(worker_id)s OR claim_expires_at IS NULL OR claim_expires_at < now())"
+)
+# Ordered scan of the partial lease index, which only holds leased rows
+_NEXT_LEASE_EXPIRY_SQL = (
+    "SELECT claim_expires_at FROM reminder"
+    " WHERE claimed_by IS NOT NULL AND claim_expires_at >= now()"
+    " AND claimed_by IS DISTINCT FROM %(worker_id)s"
+    " ORDER BY claim_expires_at LIMIT 1"
+)
+# SKIP LOCKED lets concurrent dispatchers each grab a different batch instead of waiting.
+# Rows this worker prefetched are already leased to it.
+_CLAIM_DUE_SQL = (
+    "UPDATE reminder SET claimed_by = %(worker_id)s,"
+    " claim_expires_at = now() + make_interval(secs => %(lease)s)"
+    " WHERE reminder_id IN ("
+    " SELECT reminder_id FROM reminder"
+    " WHERE is_active AND next_fire_at <= now()"
+    " AND (claimed_by = %(worker_id)s OR claim_expires_at IS NULL OR claim_expires_at < now())"
+    " ORDER BY next_fire_at LIMIT %(batch_size)s"
+    " FOR UPDATE SKIP LOCKED)"
+    " RETURNING reminder_id, user_id, r_name, r_time, r_date, r_intervals, r_message, is_active"
+)
+
+
+def _reminder_page_sql(
+    activity_filtered: bool, after: bool, before: bool, last: bool
+) -> str:
+    """
+    Dashboard page query for the given filter and keyset seek, fixed SQL fragments only:
+    every value (%(user_id)s, %(activity)s, %(after)s, %(before)s, %(page_size)s) stays bound.
+    The total is computed once and joined laterally, so an empty page still returns it.
+    COUNT(*) OVER() would only count the rows left after the keyset cursor.
+    """
+    user_filter = "user_id = %(user_id)s"
+    if activity_filtered:
+        user_filter += " AND is_active = %(activity)s"
+
+    page_filter = user_filter
+    if after:
+        page_filter += " AND r_name > %(after)s"
+    elif before:
+        page_filter += " AND r_name < %(before)s"
+    # Backward seeks read the index in reverse, the outer ORDER BY restores display order
+    descending = not after and (before or last)
+    # Last page only holds the remainder, keeping page boundaries aligned with page numbers
+    limit = (
+        "((total.count - 1) %% %(page_size)s) + 1"
+        if last and not after and not before
+        else "%(page_size)s"
+    )
+    return (
+        f"SELECT total.count, page.is_active, page.r_name, page.r_date, page.r_time"
+        f" FROM (SELECT COUNT(*) AS count FROM reminder WHERE {user_filter}) AS total"
+        f" LEFT JOIN LATERAL (SELECT is_active, r_name, r_date, r_time FROM reminder"
+        f" WHERE {page_filter} ORDER BY r_name {'DESC' if descending else 'ASC'}"
+        f" LIMIT {limit}) AS page ON TRUE"
+        f" ORDER BY page.r_name"
+    )
+
+
+# user_id -> {r_name: Reminder} in r_name order, or None for users too large to snapshot
+_snapshot_cache = TTLCache(
+    REMINDER_CACHE_USERS, REMINDER_CACHE_TTL, REMINDER_CACHE_BYTES, _snapshot_bytes
+)
+# Bumped after every committed write, a snapshot loaded across a write is not cached
+_snapshot_generation = 0
+
 
 class ReminderDAO:
     @staticmethod
-    def add_reminder(reminder: Reminder) -> bool:
+    async def add_reminder(reminder: Reminder) -> bool:
         """
         Insert new reminder with data type conversion for PostgreSQL storage.
         """
         try:
-            with psycopg.connect(
-                user=psqldb.DBUSER,
-                password=psqldb.DBPASS,
-                host=psqldb.DBHOST,
-                dbname=psqldb.DBNAME,
-            ) as connection:
-                with connection.cursor() as cursor:
+            async with psqldb.pool.connection() as connection:
+                async with connection.cursor() as cursor:
                     try:
-                        cursor.execute(
-                            "INSERT INTO reminder (user_id, r_name, r_time, r_date, r_intervals, r_message)"
-                            " VALUES (%s, %s, %s, %s, %s, %s)",
-                            (
-                                reminder.user_id,
-                                reminder.reminder_name,
-                                datetime.strptime(reminder.time, "%H:%M").time(),
-                                datetime.strptime(reminder.date, "%d/%m/%Y").date(),
-                                reminder.intervals,
-                                reminder.message,
-                            ),
+                        await cursor.execute(
+                            "INSERT INTO reminder (user_id, r_name, r_time, r_date, r_intervals, r_message, next_fire_at,"
+                            " interval_seconds, interval_weekdays)"
+                            " VALUES (%(user_id)s, %(name)s, %(time)s, %(date)s, %(intervals)s, %(message)s,"
+                            " reminder_fire_at(%(date)s + %(time)s, (SELECT timezone FROM account WHERE user_id = %(user_id)s)),"
+                            " %(seconds)s, %(weekdays)s)",
+                            {
+                                "user_id": reminder.user_id,
+                                "name": reminder.reminder_name,
+                                "time": datetime.strptime(
+                                    reminder.time, "%H:%M"
+                                ).time(),
+                                "date": datetime.strptime(
+                                    reminder.date, "%d/%m/%Y"
+                                ).date(),
+                                "intervals": reminder.intervals,
+                                "message": reminder.message,
+                                **ReminderDAO._interval_columns(reminder.intervals),
+                            },
                         )
                     except UniqueViolation as e:
                         # Expected when user tries to create reminder with same name
@@ -53,23 +208,21 @@ class ReminderDAO:
                 f"Error while inserting new reminder for user_id={reminder.user_id}: {e}"
             )
             return False
+        finally:
+            # Runs once the transaction is committed (or rolled back)
+            ReminderDAO.invalidate_snapshot(reminder.user_id)
 
     @staticmethod
-    def set_reminder_message(
+    async def set_reminder_message(
         discord_uid: int, reminder_name: str, reminder_message: str
     ) -> bool:
         """
         Update existing reminder message using user_id + reminder_name as composite key.
         """
         try:
-            with psycopg.connect(
-                user=psqldb.DBUSER,
-                password=psqldb.DBPASS,
-                host=psqldb.DBHOST,
-                dbname=psqldb.DBNAME,
-            ) as connection:
-                with connection.cursor() as cursor:
-                    cursor.execute(
+            async with psqldb.pool.connection() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(
                         "UPDATE reminder SET r_message = %s WHERE user_id = %s AND r_name = %s",
                         (reminder_message, discord_uid, reminder_name),
                     )
@@ -88,239 +241,168 @@ class ReminderDAO:
                 f"Error updating reminder message for user_id={discord_uid} and reminder_name={reminder_name}: {e}"
             )
             return False
+        finally:
+            # Runs once the transaction is committed (or rolled back)
+            ReminderDAO.invalidate_snapshot(discord_uid)
 
     @staticmethod
-    def set_reminder_time(
+    async def set_reminder_time(
         discord_uid: int, reminder_name: str, reminder_time: str
-    ) -> bool:
+    ) -> MutationOutcome:
         """
         Update reminder time with string-to-time conversion for database storage.
         """
-        try:
-            with psycopg.connect(
-                user=psqldb.DBUSER,
-                password=psqldb.DBPASS,
-                host=psqldb.DBHOST,
-                dbname=psqldb.DBNAME,
-            ) as connection:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        "UPDATE reminder SET r_time = %s WHERE user_id = %s AND r_name = %s",
-                        (
-                            datetime.strptime(reminder_time, "%H:%M").time(),
-                            discord_uid,
-                            reminder_name,
-                        ),
-                    )
-                    # Verify reminder exists and was successfully updated
-                    if cursor.rowcount == 0:
-                        logger.warning(
-                            f"No reminder found to update for user_id={discord_uid} and reminder_name={reminder_name}"
-                        )
-                        return False
-            logger.info(
-                f"Reminder time updated for user_id={discord_uid} and reminder_name={reminder_name}"
-            )
-            return True
-        except psycopg.DatabaseError as e:
-            logger.error(
-                f"Error updating reminder time for user_id={discord_uid} and reminder_name={reminder_name}: {e}"
-            )
-            return False
+        return await ReminderDAO._mutate_reminder(
+            discord_uid,
+            reminder_name,
+            _SET_TIME_SQL,
+            {"time": datetime.strptime(reminder_time, "%H:%M").time()},
+            "Reminder time updated",
+        )
 
     @staticmethod
-    def set_reminder_date(
+    async def set_reminder_date(
         discord_uid: int, reminder_name: str, reminder_date: str
-    ) -> bool:
+    ) -> MutationOutcome:
         """
         Update reminder date with string-to-date conversion for PostgreSQL storage.
         """
-        try:
-            with psycopg.connect(
-                user=psqldb.DBUSER,
-                password=psqldb.DBPASS,
-                host=psqldb.DBHOST,
-                dbname=psqldb.DBNAME,
-            ) as connection:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        "UPDATE reminder SET r_date = %s WHERE user_id = %s AND r_name = %s",
-                        (
-                            # Convert "DD/MM/YYYY" string to date object for database storage
-                            datetime.strptime(reminder_date, "%d/%m/%Y").date(),
-                            discord_uid,
-                            reminder_name,
-                        ),
-                    )
-                    # Ensure reminder was found and updated successfully
-                    if cursor.rowcount == 0:
-                        logger.warning(
-                            f"No reminder found to update for user_id={discord_uid} and reminder_name={reminder_name}"
-                        )
-                        return False
-            logger.info(
-                f"Reminder date updated for user_id={discord_uid} and reminder_name={reminder_name}"
-            )
-            return True
-        except psycopg.DatabaseError as e:
-            logger.error(
-                f"Error updating reminder date for user_id={discord_uid} and reminder_name={reminder_name}: {e}"
-            )
-            return False
+        return await ReminderDAO._mutate_reminder(
+            discord_uid,
+            reminder_name,
+            _SET_DATE_SQL,
+            # Convert "DD/MM/YYYY" string to date object for database storage
+            {"date": datetime.strptime(reminder_date, "%d/%m/%Y").date()},
+            "Reminder date updated",
+        )
 
     @staticmethod
-    def set_reminder_name(discord_uid: int, reminder_name: str, new_name: str) -> bool:
+    async def set_reminder_name(
+        discord_uid: int, reminder_name: str, new_name: str
+    ) -> MutationOutcome:
         """
         Update reminder name using old name as identifier.
+        CONFLICT when the user already has a reminder with the new name.
         """
-        try:
-            with psycopg.connect(
-                user=psqldb.DBUSER,
-                password=psqldb.DBPASS,
-                host=psqldb.DBHOST,
-                dbname=psqldb.DBNAME,
-            ) as connection:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        "UPDATE reminder SET r_name = %s WHERE user_id = %s AND r_name = %s",
-                        (new_name, discord_uid, reminder_name),
-                    )
-                    # Verify reminder was found using the old name before update
-                    if cursor.rowcount == 0:
-                        logger.warning(
-                            f"No reminder found to update for user_id={discord_uid} and reminder_name={reminder_name}"
-                        )
-                        return False
-            logger.info(
-                f"Reminder name updated for user_id={discord_uid} and reminder_name={reminder_name}"
-            )
-            return True
-        except psycopg.DatabaseError as e:
-            logger.error(
-                f"Error updating reminder name for user_id={discord_uid} and reminder_name={reminder_name}: {e}"
-            )
-            return False
+        return await ReminderDAO._mutate_reminder(
+            discord_uid,
+            reminder_name,
+            _SET_NAME_SQL,
+            {"new_name": new_name},
+            "Reminder name updated",
+        )
 
     @staticmethod
-    def set_reminder_intervals(
+    async def set_reminder_intervals(
         discord_uid: int, reminder_name: str, reminder_intervals: str
-    ) -> bool:
+    ) -> MutationOutcome:
         """
         Update reminder recurrence pattern (e.g., 'e10m2h1d' or 'w:mon,tue,fri').
         """
-        try:
-            with psycopg.connect(
-                user=psqldb.DBUSER,
-                password=psqldb.DBPASS,
-                host=psqldb.DBHOST,
-                dbname=psqldb.DBNAME,
-            ) as connection:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        "UPDATE reminder SET r_intervals = %s WHERE user_id = %s AND r_name = %s",
-                        (reminder_intervals, discord_uid, reminder_name),
-                    )
-                    # Confirm reminder exists before attempting interval modification
-                    if cursor.rowcount == 0:
-                        logger.warning(
-                            f"No reminder found to update for user_id={discord_uid} and reminder_name={reminder_name}"
-                        )
-                        return False
-            logger.info(
-                f"Reminder intervals updated for user_id={discord_uid} and reminder_name={reminder_name}"
-            )
-            return True
-        except psycopg.DatabaseError as e:
-            logger.error(
-                f"Error updating reminder intervals for user_id={discord_uid} and reminder_name={reminder_name}: {e}"
-            )
-            return False
+        return await ReminderDAO._mutate_reminder(
+            discord_uid,
+            reminder_name,
+            _SET_INTERVALS_SQL,
+            {
+                "intervals": reminder_intervals,
+                **ReminderDAO._interval_columns(reminder_intervals),
+            },
+            "Reminder intervals updated",
+        )
 
     @staticmethod
-    def delete_reminder(discord_uid: int, reminder_name: str) -> bool:
+    async def delete_reminder(discord_uid: int, reminder_name: str) -> MutationOutcome:
         """
         Permanently remove reminder from database.
         """
-        try:
-            with psycopg.connect(
-                user=psqldb.DBUSER,
-                password=psqldb.DBPASS,
-                host=psqldb.DBHOST,
-                dbname=psqldb.DBNAME,
-            ) as connection:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        "DELETE FROM reminder WHERE user_id = %s AND r_name = %s",
-                        (discord_uid, reminder_name),
-                    )
-                    # Verify reminder existed before deletion attempt
-                    if cursor.rowcount == 0:
-                        logger.warning(
-                            f"No reminder found to delete for user_id={discord_uid} and reminder_name={reminder_name}"
-                        )
-                        return False
-            logger.info(
-                f"Reminder deleted for user_id={discord_uid} and reminder_name={reminder_name}"
-            )
-            return True
-        except psycopg.DatabaseError as e:
-            logger.error(
-                f"Error deleting reminder for user_id={discord_uid} and reminder_name={reminder_name}: {e}"
-            )
-            return False
+        return await ReminderDAO._mutate_reminder(
+            discord_uid,
+            reminder_name,
+            _DELETE_SQL,
+            {},
+            "Reminder deleted",
+        )
 
     @staticmethod
-    def toggle_reminder_status(discord_uid: int, reminder_name: str) -> bool:
+    async def toggle_reminder_status(
+        discord_uid: int, reminder_name: str
+    ) -> MutationOutcome:
         """
         Switch reminder between active and inactive states using SQL NOT operator.
         Allows users to pause/resume reminders without losing configuration.
         """
+        return await ReminderDAO._mutate_reminder(
+            discord_uid,
+            reminder_name,
+            _TOGGLE_STATUS_SQL,
+            {},
+            "Reminder status toggled",
+        )
+
+    @staticmethod
+    async def _mutate_reminder(
+        discord_uid: int, reminder_name: str, statement: str, params: dict, action: str
+    ) -> MutationOutcome:
+        """
+        Apply an UPDATE/DELETE of one reminder and tell why nothing changed, in a single statement.
+        Replaces the account_exists -> reminder_exists -> mutation sequence of the edit commands.
+        """
         try:
-            with psycopg.connect(
-                user=psqldb.DBUSER,
-                password=psqldb.DBPASS,
-                host=psqldb.DBHOST,
-                dbname=psqldb.DBNAME,
-            ) as connection:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        "UPDATE reminder SET is_active = NOT is_active WHERE user_id = %s AND r_name = %s",
-                        (discord_uid, reminder_name),
+            async with psqldb.pool.connection() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(
+                        _MUTATE_REMINDER_SQL.format(statement=statement),
+                        {**params, "user_id": discord_uid, "name": reminder_name},
                     )
-                    # Confirm reminder exists before status toggle
-                    if cursor.rowcount == 0:
-                        logger.warning(
-                            f"No reminder found to update for user_id={discord_uid} and reminder_name={reminder_name}"
-                        )
-                        return False
-            logger.info(
-                f"Reminder status toggled for user_id={discord_uid} and reminder_name={reminder_name}"
+                    changed, has_account = await cursor.fetchone()
+        except UniqueViolation:
+            logger.warning(
+                f"Reminder name already taken for user_id={discord_uid} and reminder_name={reminder_name}"
             )
-            return True
+            return MutationOutcome.CONFLICT
         except psycopg.DatabaseError as e:
             logger.error(
-                f"Error toggling reminder status for user_id={discord_uid} and reminder_name={reminder_name}: {e}"
+                f"Error applying '{action}' for user_id={discord_uid} and reminder_name={reminder_name}: {e}"
             )
-            return False
+            return MutationOutcome.ERROR
+        finally:
+            # Runs once the statement is committed (or rolled back)
+            ReminderDAO.invalidate_snapshot(discord_uid)
+
+        if changed:
+            logger.info(
+                f"{action} for user_id={discord_uid} and reminder_name={reminder_name}"
+            )
+            return MutationOutcome.OK
+        if not has_account:
+            logger.warning(f"No account found for user_id={discord_uid}")
+            return MutationOutcome.NO_ACCOUNT
+        logger.warning(
+            f"No reminder found for user_id={discord_uid} and reminder_name={reminder_name}"
+        )
+        return MutationOutcome.NO_REMINDER
 
     @staticmethod
-    def reminder_exists(discord_uid: int, reminder_name: str) -> Optional[Reminder]:
+    async def reminder_exists(
+        discord_uid: int, reminder_name: str
+    ) -> Optional[Reminder]:
         """
         Retrieve full reminder data if it exists, None otherwise.
+        Answered from the user's snapshot unless the user is too large to snapshot.
         """
+        snapshot = await ReminderDAO._get_snapshot(discord_uid)
+        if snapshot is not None:
+            return snapshot.get(reminder_name)
+
         try:
-            with psycopg.connect(
-                user=psqldb.DBUSER,
-                password=psqldb.DBPASS,
-                host=psqldb.DBHOST,
-                dbname=psqldb.DBNAME,
-            ) as connection:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        "SELECT * FROM reminder WHERE user_id = %s AND r_name = %s",
+            async with psqldb.pool.connection() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(
+                        "SELECT reminder_id, r_name, r_message, r_time, r_date, r_intervals, is_active, user_id"
+                        " FROM reminder WHERE user_id = %s AND r_name = %s",
                         (discord_uid, reminder_name),
                     )
-                    result = cursor.fetchone()
+                    result = await cursor.fetchone()
             if result:
                 # Unpack database row fields in table column order
                 (
@@ -360,422 +442,500 @@ class ReminderDAO:
             return None
 
     @staticmethod
-    def get_reminder_count(discord_uid: int) -> int:
-        """
-        Get total reminder count for pagination calculations.
-        """
-        try:
-            with psycopg.connect(
-                user=psqldb.DBUSER,
-                password=psqldb.DBPASS,
-                host=psqldb.DBHOST,
-                dbname=psqldb.DBNAME,
-            ) as connection:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        "SELECT COUNT(*) FROM reminder WHERE user_id = %s",
-                        (discord_uid,),
-                    )
-                    result = cursor.fetchone()[0]
+    async def get_reminders_page(
+        discord_uid: int,
+        page_size: int,
+        activity: Optional[bool] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        last: bool = False,
+    ) -> ReminderPage:
+        """
+        Retrieve one dashboard page and the filtered reminder total in a single round trip.
+        Pages use keyset pagination on r_name: after/before are the boundary names of the page
+        currently displayed, last jumps to the final (possibly partial) page. Seeking from a name
+        instead of OFFSET keeps every page, including the last one, a short index range scan.
+        activity filters active/inactive reminders, None shows all of them.
+        Served from the user's snapshot when available.
+        """
+        snapshot = await ReminderDAO._get_snapshot(discord_uid)
+        if snapshot is not None:
+            page = ReminderDAO._page_from_snapshot(
+                snapshot, page_size, activity, after, before, last
+            )
+            if page is not None:
+                return page
 
-            if result:
-                logger.info(f"Reminder count retrieved for user_id={discord_uid}")
-                return result
-            else:
-                logger.info(f"No reminders found for user_id={discord_uid}")
-                return 0
-        except psycopg.DatabaseError as e:
-            logger.error(f"Error getting reminder count for user_id={discord_uid}: {e}")
-            return 0
+        query = _reminder_page_sql(
+            activity is not None, after is not None, before is not None, last
+        )
 
-    @staticmethod
-    def get_reminders_by_offset(
-        discord_uid: int, offset: int, page_size: int
-    ) -> List[ReminderInfo]:
-        """
-        Retrieve paginated reminders using OFFSET/LIMIT for dashboard display.
-        Returns lightweight ReminderInfo DTOs instead of full Reminder objects.
-        """
         try:
-            with psycopg.connect(
-                user=psqldb.DBUSER,
-                password=psqldb.DBPASS,
-                host=psqldb.DBHOST,
-                dbname=psqldb.DBNAME,
-            ) as connection:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        "SELECT is_active, r_name, r_date, r_time FROM reminder WHERE user_id = %s ORDER BY r_name OFFSET %s LIMIT %s",
-                        (discord_uid, offset, page_size),
+            async with psqldb.pool.connection() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(
+                        query,
+                        {
+                            "user_id": discord_uid,
+                            "activity": activity,
+                            "after": after,
+                            "before": before,
+                            "page_size": page_size,
+                        },
                     )
-                    result = cursor.fetchall()
+                    result = await cursor.fetchall()
 
-            if result:
-                reminders = []
-                for row in result:
-                    is_active, r_name, r_date, r_time = row
-
-                    # Create DTO with formatted strings for immediate display
-                    reminder = ReminderInfo(
-                        is_active=is_active,
-                        name=r_name,
-                        date=r_date.strftime("%d/%m/%Y") if r_date else "",
-                        time=r_time.strftime("%H:%M") if r_time else "",
-                    )
-                    reminders.append(reminder)
+            total = result[0][0] if result else 0
+            reminders = []
+            for row in result:
+                _, is_active, r_name, r_date, r_time = row
+                # LEFT JOIN yields a single all-NULL page row when the page is empty
+                if r_name is None:
+                    continue
+
+                # Create DTO with formatted strings for immediate display
+                reminder = ReminderInfo(
+                    is_active=is_active,
+                    name=r_name,
+                    date=r_date.strftime("%d/%m/%Y") if r_date else "",
+                    time=r_time.strftime("%H:%M") if r_time else "",
+                )
+                reminders.append(reminder)
 
-                logger.info(f"Reminder retrieved for user_id={discord_uid}")
-                return reminders
-            else:
-                logger.info(f"No reminders found for user_id={discord_uid}")
-                return []
+            logger.info(
+                f"Reminder page retrieved for user_id={discord_uid} and activity={activity}"
+            )
+            return ReminderPage(reminders=reminders, total=total)
         except psycopg.DatabaseError as e:
-            logger.error(f"Error getting reminder for user_id={discord_uid}: {e}")
-            return []
+            logger.error(
+                f"Error getting reminder page for user_id={discord_uid} and activity={activity}: {e}"
+            )
+            return ReminderPage(reminders=[], total=0)
 
     @staticmethod
-    def get_reminders_by_offset_activity(
-        discord_uid: int, offset: int, page_size: int, activity: bool
-    ) -> List[ReminderInfo]:
-        """
-        Retrieve paginated reminders filtered by active/inactive status.
-        Enables filtered dashboard views (show only active or only inactive reminders).
+    async def get_fire_schedule(
+        before: datetime,
+        after: Optional[datetime] = None,
+        worker_id: Optional[str] = None,
+    ) -> List[Tuple[int, datetime]]:
+        """
+        List (reminder_id, next_fire_at) of active reminders firing before the given time,
+        from `after` on if given, overdue ones included otherwise.
+        Reminders under a live lease of another worker are left out: they come back through
+        the change feed once completed, or once the lease has expired (get_next_lease_expiry).
+        Only ids and times are read, the scheduler keeps nothing else.
         """
         try:
-            with psycopg.connect(
-                user=psqldb.DBUSER,
-                password=psqldb.DBPASS,
-                host=psqldb.DBHOST,
-                dbname=psqldb.DBNAME,
-            ) as connection:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        "SELECT is_active, r_name, r_date, r_time FROM reminder WHERE user_id = %s AND is_active = %s ORDER BY r_name OFFSET %s LIMIT %s",
-                        (discord_uid, activity, offset, page_size),
-                    )
-                    result = cursor.fetchall()
-
-            if result:
-                reminders = []
-                for row in result:
-                    is_active, r_name, r_date, r_time = row
-
-                    # Convert database types to display-ready string formats
-                    reminder = ReminderInfo(
-                        is_active=is_active,
-                        name=r_name,
-                        date=r_date.strftime("%d/%m/%Y") if r_date else "",
-                        time=r_time.strftime("%H:%M") if r_time else "",
+            async with psqldb.pool.connection() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(
+                        _FIRE_SCHEDULE_SQL,
+                        {"before": before, "after": after, "worker_id": worker_id},
                     )
-                    reminders.append(reminder)
-
-                logger.info(
-                    f"Reminder retrieved for user_id={discord_uid} and activity={activity}"
-                )
-                return reminders
-            else:
-                logger.info(
-                    f"No reminders found for user_id={discord_uid} and activity={activity}"
-                )
-                return []
+                    return await cursor.fetchall()
         except psycopg.DatabaseError as e:
-            logger.error(
-                f"Error getting reminder for user_id={discord_uid} and activity={activity}: {e}"
-            )
+            logger.error(f"Error getting reminder fire schedule: {e}")
             return []
 
     @staticmethod
-    def get_reminder_count_by_activity(discord_uid: int, activity: bool) -> int:
+    async def get_next_lease_expiry(
+        worker_id: Optional[str] = None,
+    ) -> Optional[datetime]:
         """
-        Get count of reminders filtered by active/inactive status for pagination.
-        Used to calculate total pages in filtered dashboard views.
+        Earliest expiry of a live lease held by another worker, when the reminders it
+        keeps out of get_fire_schedule() become claimable again. None without such leases.
         """
         try:
-            with psycopg.connect(
-                user=psqldb.DBUSER,
-                password=psqldb.DBPASS,
-                host=psqldb.DBHOST,
-                dbname=psqldb.DBNAME,
-            ) as connection:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        "SELECT COUNT(*) FROM reminder WHERE user_id = %s AND is_active = %s",
-                        (discord_uid, activity),
+            async with psqldb.pool.connection() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(
+                        _NEXT_LEASE_EXPIRY_SQL,
+                        {"worker_id": worker_id},
                     )
-                    result = cursor.fetchone()[0]
-
-            if result:
-                logger.info(
-                    f"Reminder count by activity retrieved for user_id={discord_uid} and activity={activity}"
-                )
-                return result
-            else:
-                logger.info(
-                    f"No reminders found for user_id={discord_uid} and activity={activity}"
-                )
-                return 0
+                    row = await cursor.fetchone()
+                    return row[0] if row else None
         except psycopg.DatabaseError as e:
-            logger.error(
-                f"Error getting reminder count by activity for user_id={discord_uid}, activity={activity}: {e}"
-            )
-            return 0
+            logger.error(f"Error getting the next lease expiry: {e}")
+            return None
 
     @staticmethod
-    def get_due_reminders(current_time: datetime) -> List[Reminder]:
+    async def claim_due_reminders(
+        worker_id: str, batch_size: int, lease_seconds: int
+    ) -> List[Reminder]:
         """
-        Find all active reminders scheduled at or before current time.
-        Used by reminder task to determine which reminders need to be sent.
+        Lease a bounded batch of due reminders to this worker.
+        SKIP LOCKED lets concurrent dispatchers each grab a different batch instead of waiting,
+        and reminders whose lease expired (crashed worker) become claimable again.
+        Must be followed by complete_reminders() once the batch has been sent.
         """
         try:
-            with psycopg.connect(
-                user=psqldb.DBUSER,
-                password=psqldb.DBPASS,
-                host=psqldb.DBHOST,
-                dbname=psqldb.DBNAME,
-            ) as connection:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        # Check three conditions: active, correct date, time has passed
-                        "SELECT user_id, r_name, r_time, r_date, r_intervals, r_message, is_active FROM reminder WHERE is_active = %s AND r_date = %s AND r_time <= %s",
-                        (True, current_time.date(), current_time.time()),
+            async with psqldb.pool.connection() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(
+                        _CLAIM_DUE_SQL,
+                        {
+                            "worker_id": worker_id,
+                            "lease": lease_seconds,
+                            "batch_size": batch_size,
+                        },
                     )
-                    result = cursor.fetchall()
+                    result = await cursor.fetchall()
 
-            reminders = []
-            for row in result:
-                user_id, reminder_name, time, date, intervals, message, status = row
-
-                # Convert database types back to Reminder model format for processing
-                reminder = Reminder(
-                    user_id=user_id,
-                    reminder_name=reminder_name,
-                    time=time.strftime("%H:%M") if time else "",
-                    date=date.strftime("%d/%m/%Y") if date else "",
-                    intervals=intervals or "",
-                    message=message or "",
-                    status=status,
-                )
-                reminders.append(reminder)
-
-            logger.info(f"{len(reminders)} due reminders retrieved")
+            reminders = [ReminderDAO._row_to_reminder(row) for row in result]
+            logger.info(f"{len(reminders)} due reminders claimed by {worker_id}")
             return reminders
         except psycopg.DatabaseError as e:
             # Return empty list to prevent reminder task from failing
-            logger.error(f"Error getting due reminders: {e}")
+            logger.error(f"Error claiming due reminders: {e}")
             return []
 
     @staticmethod
-    def update_reminder_date_time(reminder: Reminder) -> bool:
+    async def prefetch_reminders(
+        worker_id: str, within_seconds: float, limit: int, lease_seconds: int
+    ) -> List[Tuple[datetime, Reminder]]:
         """
-        Reschedule recurring reminder to its next occurrence after being sent.
-        Complex operation involving interval parsing and datetime calculations.
+        Lease every reminder due within the look-ahead window and return it with its fire time,
+        so it can be sent without a query when due. Reminders this worker already leased are
+        returned again, which refreshes them after an edit.
         """
-        if not reminder.intervals:
-            # One-time reminders don't need rescheduling
-            logger.info(f"No interval specified for reminder {reminder.reminder_name}")
-            return True
-
         try:
-            # Step 1: Parse current reminder datetime from string format
-            current_datetime = ReminderDAO._parse_reminder_datetime(reminder)
-            if not current_datetime:
-                logger.error(
-                    f"Could not parse current datetime for reminder {reminder.reminder_name}"
-                )
-                return False
-
-            # Step 2: Calculate when the reminder should next occur
-            next_datetime = ReminderDAO._calculate_next_occurrence(
-                current_datetime, reminder.intervals
-            )
-            if not next_datetime:
-                logger.error(
-                    f"Could not calculate next occurrence for reminder {reminder.reminder_name}"
-                )
-                return False
+            async with psqldb.pool.connection() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(
+                        "UPDATE reminder SET claimed_by = %(worker_id)s,"
+                        " claim_expires_at = now() + make_interval(secs => %(lease)s)"
+                        " WHERE reminder_id IN ("
+                        " SELECT reminder_id FROM reminder"
+                        " WHERE is_active AND next_fire_at <= now() + make_interval(secs => %(within)s)"
+                        " AND (claimed_by = %(worker_id)s OR claim_expires_at IS NULL OR claim_expires_at < now())"
+                        " ORDER BY next_fire_at LIMIT %(limit)s"
+                        " FOR UPDATE SKIP LOCKED)"
+                        " RETURNING reminder_id, user_id, r_name, r_time, r_date, r_intervals, r_message, is_active,"
+                        " next_fire_at",
+                        {
+                            "worker_id": worker_id,
+                            "lease": lease_seconds,
+                            "within": within_seconds,
+                            "limit": limit,
+                        },
+                    )
+                    result = await cursor.fetchall()
 
-            # Step 3: Update database with new scheduled time
-            return ReminderDAO._update_reminder_datetime_in_db(reminder, next_datetime)
+            return [(row[8], ReminderDAO._row_to_reminder(row[:8])) for row in result]
+        except psycopg.DatabaseError as e:
+            logger.error(f"Error prefetching upcoming reminders: {e}")
+            return []
 
-        except Exception as e:
-            logger.error(
-                f"Error updating reminder date/time for {reminder.reminder_name}: {e}"
-            )
-            return False
+    @staticmethod
+    async def release_claims(worker_id: str) -> int:
+        """Hand every lease of a worker back, e.g. prefetched reminders when leadership is lost."""
+        try:
+            async with psqldb.pool.connection() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(
+                        "UPDATE reminder SET claimed_by = NULL, claim_expires_at = NULL"
+                        " WHERE claimed_by = %s",
+                        (worker_id,),
+                    )
+                    return cursor.rowcount
+        except psycopg.DatabaseError as e:
+            # Leases still expire on their own
+            logger.error(f"Error releasing claims of {worker_id}: {e}")
+            return 0
 
     @staticmethod
-    def _parse_reminder_datetime(reminder: Reminder) -> Optional[datetime]:
+    async def reserve_missed_reminders(
+        worker_id: str, before: datetime, lease_seconds: int
+    ) -> int:
         """
-        Convert reminder's string date/time fields to datetime object for calculations.
-        Handles the format conversion between model strings and Python datetime.
+        Lease every unclaimed reminder due before `before` to worker_id without reading it,
+        so other claims skip them until claim_missed_reminders() processes them in batches.
+        Calling it again extends the leases still held. Returns the number of reminders leased.
         """
         try:
-            date_str = reminder.date  # Format: DD/MM/YYYY
-            time_str = reminder.time  # Format: HH:MM
-
-            if not date_str or not time_str:
-                return None
-
-            # Manual parsing to match the expected DD/MM/YYYY format
-            day, month, year = map(int, date_str.split("/"))
-            hour, minute = map(int, time_str.split(":"))
-
-            return datetime(year, month, day, hour, minute)
-
-        except (ValueError, AttributeError) as e:
-            logger.error(f"Error parsing datetime from reminder: {e}")
-            return None
+            async with psqldb.pool.connection() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(
+                        "UPDATE reminder SET claimed_by = %(worker_id)s,"
+                        " claim_expires_at = now() + make_interval(secs => %(lease)s)"
+                        " WHERE is_active AND next_fire_at < %(before)s"
+                        " AND (claimed_by = %(worker_id)s OR claim_expires_at IS NULL OR claim_expires_at < now())",
+                        {
+                            "worker_id": worker_id,
+                            "lease": lease_seconds,
+                            "before": before,
+                        },
+                    )
+                    return cursor.rowcount
+        except psycopg.DatabaseError as e:
+            logger.error(f"Error reserving missed reminders: {e}")
+            return 0
 
     @staticmethod
-    def _calculate_next_occurrence(
-        current_datetime: datetime, interval: str
-    ) -> Optional[datetime]:
-        """
-        Route interval calculation to appropriate handler based on pattern.
-        Supports two patterns: weekly (w:) and regular time-based (e).
+    async def claim_missed_reminders(
+        worker_id: str,
+        before: datetime,
+        batch_size: int,
+        lease_seconds: int,
+        max_occurrences: int,
+    ) -> List[Tuple[Reminder, int]]:
+        """
+        Lease a bounded batch of reminders that were due before `before`, oldest first,
+        each with the number of its occurrences missed up to now (at most max_occurrences).
+        Like claim_due_reminders, must be followed by complete_reminders().
         """
         try:
-            if interval.startswith("w:"):
-                # Weekly pattern: w:mon,tue,fri or w:*
-                return ReminderDAO._calculate_weekly_next(current_datetime, interval)
-
-            elif interval.startswith("e"):
-                # Regular pattern: e10m2h1d (every 10 minutes, 2 hours, 1 day)
-                return ReminderDAO._calculate_regular_next(current_datetime, interval)
-
-            else:
-                logger.error(f"Invalid interval format: {interval}")
-                return None
+            async with psqldb.pool.connection() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(
+                        "UPDATE reminder SET claimed_by = %(worker_id)s,"
+                        " claim_expires_at = now() + make_interval(secs => %(lease)s)"
+                        " WHERE reminder_id IN ("
+                        " SELECT reminder_id FROM reminder"
+                        " WHERE is_active AND next_fire_at < %(before)s"
+                        " AND (claimed_by = %(worker_id)s OR claim_expires_at IS NULL OR claim_expires_at < now())"
+                        " ORDER BY next_fire_at LIMIT %(batch_size)s"
+                        " FOR UPDATE SKIP LOCKED)"
+                        " RETURNING reminder_id, user_id, r_name, r_time, r_date, r_intervals, r_message, is_active,"
+                        " reminder_missed_occurrences(r_date + r_time, interval_seconds, interval_weekdays,"
+                        f" reminder_local_now({_OWNER_TIMEZONE}), %(max_occurrences)s)",
+                        {
+                            "worker_id": worker_id,
+                            "lease": lease_seconds,
+                            "before": before,
+                            "batch_size": batch_size,
+                            "max_occurrences": max_occurrences,
+                        },
+                    )
+                    result = await cursor.fetchall()
 
-        except Exception as e:
-            logger.error(f"Error calculating next occurrence: {e}")
-            return None
+            missed = [(ReminderDAO._row_to_reminder(row[:8]), row[8]) for row in result]
+            logger.info(f"{len(missed)} missed reminders claimed by {worker_id}")
+            return missed
+        except psycopg.DatabaseError as e:
+            logger.error(f"Error claiming missed reminders: {e}")
+            return []
 
     @staticmethod
-    def _calculate_weekly_next(
-        current_datetime: datetime, interval: str
-    ) -> Optional[datetime]:
+    async def complete_reminders(
+        worker_id: str, reminder_ids: List[int]
+    ) -> Dict[int, bool]:
         """
-        Calculate next weekly occurrence by finding the next matching weekday.
-        Preserves original time while advancing to next valid day.
+        Release the leases of sent reminders and move them to their next occurrence in one UPDATE.
+        reminder_occurrence_after() advances recurring reminders server-side past the current time,
+        so a late reminder is not re-sent for every occurrence it missed; one-time reminders are
+        retired. A reminder whose lease was lost (expired or reset by an edit) is left untouched
+        and reported as False.
         """
-        try:
-            days_part = interval[2:]  # Remove "w:" prefix
-            days = [day.strip().lower() for day in days_part.split(",")]
-
-            # Map day names to Python weekday numbers (Monday=0)
-            day_mapping = {
-                "mon": 0,
-                "tue": 1,
-                "wed": 2,
-                "thu": 3,
-                "fri": 4,
-                "sat": 5,
-                "sun": 6,
-            }
-
-            target_weekdays = [day_mapping[day] for day in days if day in day_mapping]
-
-            if not target_weekdays:
-                return None
+        if not reminder_ids:
+            return {}
 
-            # Check next 7 days to find the next matching weekday
-            for i in range(1, 8):
-                check_date = current_datetime + timedelta(days=i)
-                if check_date.weekday() in target_weekdays:
-                    # Preserve original time, only change date
-                    return datetime(
-                        check_date.year,
-                        check_date.month,
-                        check_date.day,
-                        current_datetime.hour,
-                        current_datetime.minute,
+        results = {reminder_id: False for reminder_id in reminder_ids}
+        try:
+            async with psqldb.pool.connection() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(
+                        "UPDATE reminder AS r SET"
+                        " r_date = COALESCE(due.next_at::date, r.r_date),"
+                        " r_time = COALESCE(due.next_at::time, r.r_time),"
+                        " next_fire_at = reminder_fire_at(due.next_at, due.timezone),"
+                        " claimed_by = NULL, claim_expires_at = NULL"
+                        # Recurrences advance in the owner's wall-clock time, so DST changes keep the hour
+                        " FROM (SELECT reminder_id, timezone, reminder_occurrence_after(r_date + r_time,"
+                        " interval_seconds, interval_weekdays, reminder_local_now(timezone)) AS next_at"
+                        " FROM reminder JOIN account USING (user_id)"
+                        " WHERE reminder_id = ANY(%(ids)s) AND claimed_by = %(worker_id)s"
+                        " FOR UPDATE OF reminder) AS due"
+                        " WHERE r.reminder_id = due.reminder_id"
+                        " RETURNING r.reminder_id, r.user_id",
+                        {"ids": reminder_ids, "worker_id": worker_id},
                     )
+                    completed = await cursor.fetchall()
 
-            return None
+            for reminder_id, user_id in completed:
+                results[reminder_id] = True
+                # Snapshots still show the date and time that just fired
+                ReminderDAO.invalidate_snapshot(user_id)
 
-        except Exception as e:
-            logger.error(f"Error calculating weekly next occurrence: {e}")
-            return None
+            logger.info(
+                f"{sum(results.values())}/{len(reminder_ids)} claimed reminders completed by {worker_id}"
+            )
+            return results
+        except psycopg.DatabaseError as e:
+            # Leases simply expire, so the batch is retried by the next claim
+            logger.error(f"Error completing {len(reminder_ids)} claimed reminders: {e}")
+            return results
 
     @staticmethod
-    def _calculate_regular_next(
-        current_datetime: datetime, interval: str
-    ) -> Optional[datetime]:
+    def _row_to_reminder(row: tuple) -> Reminder:
+        """
+        Convert a (reminder_id, user_id, r_name, r_time, r_date, r_intervals, r_message, is_active)
+        row back to the Reminder model format used by the dispatcher.
+        """
+        (
+            reminder_id,
+            user_id,
+            reminder_name,
+            time,
+            date,
+            intervals,
+            message,
+            status,
+        ) = row
+        return Reminder(
+            user_id=user_id,
+            reminder_name=reminder_name,
+            time=time.strftime("%H:%M") if time else "",
+            date=date.strftime("%d/%m/%Y") if date else "",
+            intervals=intervals or "",
+            message=message or "",
+            reminder_id=reminder_id,
+            status=status,
+        )
+
+    @staticmethod
+    async def search_reminder_names(
+        discord_uid: int, current: str, limit: int = 25
+    ) -> List[str]:
         """
-        Calculate next regular interval occurrence by parsing time components.
-        Supports combined intervals like e10m2h1d (10 minutes + 2 hours + 1 day).
+        Reminder names containing the typed text, for slash command autocomplete.
+        Autocomplete fires on every keystroke, so it is answered from the snapshot when possible.
         """
-        try:
-            interval = interval[1:]  # Remove "e" prefix
+        snapshot = await ReminderDAO._get_snapshot(discord_uid)
+        if snapshot is not None:
+            current = current.lower()
+            return [name for name in snapshot if current in name.lower()][:limit]
 
-            # Initialize all time components
-            minutes = 0
-            hours = 0
-            days = 0
-
-            # Extract each time component using regex
-            minute_match = re.search(r"(\d+)m", interval)
-            hour_match = re.search(r"(\d+)h", interval)
-            day_match = re.search(r"(\d+)d", interval)
-
-            if minute_match:
-                minutes = int(minute_match.group(1))
-            if hour_match:
-                hours = int(hour_match.group(1))
-            if day_match:
-                days = int(day_match.group(1))
+        try:
+            async with psqldb.pool.connection() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(
+                        "SELECT r_name FROM reminder WHERE user_id = %s AND r_name ILIKE %s"
+                        " ORDER BY r_name LIMIT %s",
+                        (discord_uid, f"%{current}%", limit),
+                    )
+                    return [r_name for (r_name,) in await cursor.fetchall()]
+        except psycopg.DatabaseError as e:
+            logger.error(
+                f"Error searching reminder names for user_id={discord_uid}: {e}"
+            )
+            return []
 
-            # Combine all time components into single timedelta
-            delta = timedelta(days=days, hours=hours, minutes=minutes)
-            next_datetime = current_datetime + delta
+    @staticmethod
+    def invalidate_snapshot(discord_uid: int):
+        """Forget a user's snapshot after a write, the next read reloads it."""
+        global _snapshot_generation
+        _snapshot_generation += 1
+        _snapshot_cache.invalidate(discord_uid)
 
-            return next_datetime
+    @staticmethod
+    def clear_snapshots():
+        """Forget every snapshot, used when change events may have been missed."""
+        global _snapshot_generation
+        _snapshot_generation += 1
+        _snapshot_cache.clear()
 
-        except Exception as e:
-            logger.error(f"Error calculating regular next occurrence: {e}")
-            return None
+    @staticmethod
+    def snapshot_cache_stats() -> dict:
+        """Hit/miss counters and estimated bytes of the reminder snapshot cache."""
+        return _snapshot_cache.stats()
 
     @staticmethod
-    def _update_reminder_datetime_in_db(
-        reminder: Reminder, next_datetime: datetime
-    ) -> bool:
+    async def _get_snapshot(discord_uid: int) -> Optional[Dict[str, Reminder]]:
         """
-        Update reminder's scheduled date and time in database with calculated next occurrence.
-        Final step in the recurring reminder rescheduling process.
+        Return every reminder of a user keyed by name in r_name order, loaded with one query on a miss.
+        None means the user has too many reminders to snapshot (or the load failed)
+        and callers must query Postgres directly.
         """
+        cached = _snapshot_cache.get(discord_uid)
+        if cached is not MISSING:
+            return cached
+
+        generation = _snapshot_generation
         try:
-            with psycopg.connect(
-                user=psqldb.DBUSER,
-                password=psqldb.DBPASS,
-                host=psqldb.DBHOST,
-                dbname=psqldb.DBNAME,
-            ) as connection:
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        "UPDATE reminder SET r_date = %s, r_time = %s WHERE user_id = %s AND r_name = %s",
-                        (
-                            # Convert datetime back to separate date and time for database storage
-                            next_datetime.date(),
-                            next_datetime.time(),
-                            reminder.user_id,
-                            reminder.reminder_name,
-                        ),
+            async with psqldb.pool.connection() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(
+                        "SELECT reminder_id, user_id, r_name, r_time, r_date, r_intervals, r_message, is_active"
+                        " FROM reminder WHERE user_id = %s ORDER BY r_name LIMIT %s",
+                        (discord_uid, REMINDER_SNAPSHOT_MAX + 1),
                     )
-                    # Verify reminder still exists
-                    if cursor.rowcount == 0:
-                        logger.warning(
-                            f"No reminder found to update for user_id={reminder.user_id} and reminder_name={reminder.reminder_name}"
-                        )
-                        return False
-
-            logger.info(
-                f"Reminder datetime updated for user_id={reminder.user_id} and reminder_name={reminder.reminder_name}. Next occurrence: {next_datetime}"
-            )
-            return True
-
+                    result = await cursor.fetchall()
         except psycopg.DatabaseError as e:
             logger.error(
-                f"Error updating reminder datetime for user_id={reminder.user_id} and reminder_name={reminder.reminder_name}: {e}"
+                f"Error loading reminder snapshot for user_id={discord_uid}: {e}"
             )
-            return False
+            return None
+
+        if len(result) > REMINDER_SNAPSHOT_MAX:
+            snapshot = None
+        else:
+            snapshot = {}
+            for row in result:
+                reminder = ReminderDAO._row_to_reminder(row)
+                snapshot[reminder.reminder_name] = reminder
+
+        # A write committed while loading may be missing from the rows read
+        if generation == _snapshot_generation:
+            _snapshot_cache.set(discord_uid, snapshot)
+        return snapshot
+
+    @staticmethod
+    def _page_from_snapshot(
+        snapshot: Dict[str, Reminder],
+        page_size: int,
+        activity: Optional[bool],
+        after: Optional[str],
+        before: Optional[str],
+        last: bool,
+    ) -> Optional[ReminderPage]:
+        """
+        Build the same page as the keyset query from an in-memory snapshot.
+        Returns None when the cursor name is no longer part of the snapshot.
+        """
+        reminders = [
+            reminder
+            for reminder in snapshot.values()
+            if activity is None or reminder.status == activity
+        ]
+        names = [reminder.reminder_name for reminder in reminders]
+        total = len(reminders)
+
+        # Positions rather than string comparisons, Python and Postgres collations may disagree
+        if after is not None:
+            if after not in names:
+                return None
+            start = names.index(after) + 1
+            end = start + page_size
+        elif before is not None:
+            if before not in names:
+                return None
+            end = names.index(before)
+            start = max(end - page_size, 0)
+        elif last:
+            # Last page only holds the remainder
+            start = ((total - 1) // page_size) * page_size if total else 0
+            end = total
+        else:
+            start = 0
+            end = page_size
+
+        return ReminderPage(
+            reminders=[
+                ReminderInfo(
+                    is_active=reminder.status,
+                    name=reminder.reminder_name,
+                    date=reminder.date,
+                    time=reminder.time,
+                )
+                for reminder in reminders[start:end]
+            ],
+            total=total,
+        )
+
+    @staticmethod
+    def _interval_columns(intervals: str) -> Dict[str, Optional[int]]:
+        """Compiled form of an intervals string, as interval_seconds/interval_weekdays parameters."""
+        compiled = Interval.parse(intervals)
+        seconds, weekdays = compiled.columns() if compiled else (None, None)
+        return {"seconds": seconds, "weekdays": weekdays}
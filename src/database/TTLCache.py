@@ -0,0 +1,96 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+# Returned by TTLCache.get on a miss, so None can be cached as a negative result
+MISSING = object()
+
+
+class TTLCache:
+    """
+    Bounded in-process cache with per-entry expiry and least-recently-used eviction.
+    Optionally bounded by total weight too (e.g. estimated bytes) through a weigher.
+    Counts hits, misses and evictions so cache effectiveness can be monitored.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        maxweight: Optional[int] = None,
+        weigher: Optional[Callable[[Any], int]] = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.maxweight = maxweight
+        self.weigher = weigher
+        self.weight = 0
+        # key -> (expires_at, value, weight), ordered from least to most recently used
+        self._entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value, or MISSING if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return MISSING
+
+        expires_at, value, _ = entry
+        if expires_at <= time.monotonic():
+            self.invalidate(key)
+            self.misses += 1
+            return MISSING
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """
+        Store a value, evicting the least recently used entries beyond maxsize/maxweight.
+        A value heavier than maxweight on its own is not cached at all.
+        """
+        self.invalidate(key)
+        weight = self.weigher(value) if self.weigher else 0
+        if self.maxweight is not None and weight > self.maxweight:
+            return
+
+        self._entries[key] = (time.monotonic() + (ttl or self.ttl), value, weight)
+        self.weight += weight
+        while len(self._entries) > self.maxsize or (
+            self.maxweight is not None and self.weight > self.maxweight
+        ):
+            _, (_, _, evicted_weight) = self._entries.popitem(last=False)
+            self.weight -= evicted_weight
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable):
+        """Drop a single entry, if cached."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.weight -= entry[2]
+
+    def clear(self):
+        """Drop every entry, counters are kept."""
+        self._entries.clear()
+        self.weight = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current occupancy for monitoring."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "weight": self.weight,
+            "maxweight": self.maxweight,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
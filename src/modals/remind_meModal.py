@@ -1,6 +1,6 @@
 import discord
 import logging
-from datetime import datetime
+from src.models.Account import Account
 from src.models.Reminder import Reminder
 from src.database.ReminderDAO import ReminderDAO
 
@@ -40,10 +40,9 @@ class RemindMeModal(discord.ui.Modal, title="New Reminder"):
         max_length=5,
         required=True,
     )
-    # Optional field with today's date as visual example
+    # Optional field with today's date as visual example, set per user in __init__
     date_input = discord.ui.TextInput(
         label="Date (default: today)",
-        placeholder=datetime.now().strftime("%d/%m/%Y"),
         style=discord.TextStyle.short,
         max_length=10,
         required=False,
@@ -64,6 +63,12 @@ class RemindMeModal(discord.ui.Modal, title="New Reminder"):
         required=True,
     )
 
+    def __init__(self, timezone: str = ""):
+        """Show and default to today's date in the timezone of the user's account."""
+        super().__init__()
+        self.timezone = timezone
+        self.date_input.placeholder = Account.local_now(timezone).strftime("%d/%m/%Y")
+
     async def on_submit(self, interaction: discord.Interaction):
         """
         Process form submission with client-side validation before database interaction.
@@ -107,13 +112,14 @@ class RemindMeModal(discord.ui.Modal, title="New Reminder"):
             interaction.user.id,
             self.name_input.value,
             self.time_input.value,
-            # Apply default date logic consistently with Reminder model
-            datetime.now().strftime("%d/%m/%Y") if self.date_input.value == "" else self.date_input.value,
+            # Empty date defaults to today in the user's timezone, filled by the Reminder model
+            self.date_input.value,
             self.intervals_input.value,
             self.message_input.value,
+            timezone=self.timezone,
         )
         try:
-            success = ReminderDAO.add_reminder(reminder)
+            success = await ReminderDAO.add_reminder(reminder)
             if success:
                 await interaction.response.send_message(
                     embed=self.embeds_remind_me["success"], ephemeral=True
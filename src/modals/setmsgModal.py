@@ -50,7 +50,7 @@ class SetMsgModal(discord.ui.Modal, title="Edit Reminder Message"):
             return
 
         try:
-            success = ReminderDAO.set_reminder_message(
+            success = await ReminderDAO.set_reminder_message(
                 interaction.user.id, self.reminder_name, self.message_input.value
             )
             if success:
@@ -26,7 +26,7 @@ class SetzModal(discord.ui.Modal, title="Timezone Setup"):
 
     async def on_submit(self, interaction: discord.Interaction):
         """Handle timezone setting with server-side validation."""
-        if AccountDAO.set_timezone(interaction.user.id, self.tz_input.value):
+        if await AccountDAO.set_timezone(interaction.user.id, self.tz_input.value):
             await interaction.response.send_message(
                 embed=self.embeds_submit["success"], ephemeral=True
             )
@@ -1,9 +1,18 @@
-import pytz
 import logging
+from datetime import datetime, timezone as dt_timezone
+from functools import lru_cache
+from typing import Optional
+from zoneinfo import ZoneInfo, available_timezones
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _known_timezones() -> frozenset:
+    """IANA timezone names, listing them scans the tz database so it is done once."""
+    return frozenset(available_timezones())
+
+
 class Account:
     """Represents user account data separate from Discord user objects."""
 
@@ -14,8 +23,8 @@ class Account:
 
     @staticmethod
     def is_a_timezone(timezone: str) -> bool:
-        """Validate timezone string against pytz database."""
-        if timezone in pytz.all_timezones:
+        """Validate timezone string against the IANA database used by zoneinfo."""
+        if timezone in _known_timezones():
             # Log valid timezones for debugging user setup success
             logger.info(f"Valid timezone: {timezone}")
             return True
@@ -23,3 +32,13 @@ class Account:
             # Log invalid attempts to help troubleshoot user input issues
             logger.error(f"Invalid timezone: {timezone}")
             return False
+
+    @staticmethod
+    def local_now(timezone: Optional[str]) -> datetime:
+        """
+        Current wall-clock time (naive) in a timezone, as reminder dates and times are stored.
+        Accounts without (or with an unknown) timezone use UTC, like reminder_local_now() in SQL.
+        """
+        if timezone and timezone in _known_timezones():
+            return datetime.now(ZoneInfo(timezone)).replace(tzinfo=None)
+        return datetime.now(dt_timezone.utc).replace(tzinfo=None)
@@ -0,0 +1,72 @@
+import re
+from functools import lru_cache
+from datetime import timedelta
+from typing import Optional, Tuple
+
+# Weekday numbers of w: intervals, as returned by datetime.weekday()
+WEEKDAYS = {"mon": 0, "tue": 1, "wed": 2, "thu": 3, "fri": 4, "sat": 5, "sun": 6}
+ALL_WEEKDAYS = 0b1111111
+
+
+class Interval:
+    """
+    Recurrence of a reminder compiled from its intervals string, so rescheduling never parses.
+    Either a fixed period in seconds (e10m2h1d) or a 7-bit weekday mask (w:mon,fri, bit 0 = Monday).
+    Instances are shared through Interval.parse's cache and must not be modified.
+    """
+
+    __slots__ = ("period_seconds", "weekday_mask")
+
+    def __init__(self, period_seconds: int = 0, weekday_mask: int = 0):
+        self.period_seconds = period_seconds
+        self.weekday_mask = weekday_mask
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def parse(intervals: Optional[str]) -> Optional["Interval"]:
+        """
+        Compile an intervals string, None for one-time reminders and patterns that never recur.
+        Only a handful of distinct strings exist, so each one is parsed once per process.
+        """
+        if not intervals:
+            return None
+        if intervals.startswith("w:"):
+            days = intervals[2:]
+            if days == "*":
+                return Interval(weekday_mask=ALL_WEEKDAYS)
+            mask = 0
+            for day in days.split(","):
+                weekday = WEEKDAYS.get(day.strip().lower())
+                if weekday is not None:
+                    mask |= 1 << weekday
+            return Interval(weekday_mask=mask) if mask else None
+        if intervals.startswith("e"):
+            parts = {
+                unit: int(count)
+                for count, unit in re.findall(r"(\d+)([mhd])", intervals)
+            }
+            period = timedelta(
+                days=parts.get("d", 0),
+                hours=parts.get("h", 0),
+                minutes=parts.get("m", 0),
+            )
+            seconds = int(period.total_seconds())
+            return Interval(period_seconds=seconds) if seconds else None
+        return None
+
+    def columns(self) -> Tuple[Optional[int], Optional[int]]:
+        """(interval_seconds, interval_weekdays) column values, the unused one is NULL."""
+        return self.period_seconds or None, self.weekday_mask or None
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, Interval)
+            and self.period_seconds == other.period_seconds
+            and self.weekday_mask == other.weekday_mask
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.period_seconds, self.weekday_mask))
+
+    def __repr__(self) -> str:
+        return f"Interval(period_seconds={self.period_seconds}, weekday_mask={self.weekday_mask:#09b})"
@@ -1,6 +1,8 @@
 import re
 from datetime import datetime
+from typing import Optional
 import logging
+from src.models.Account import Account
 
 logger = logging.getLogger(__name__)
 
@@ -18,13 +20,15 @@ class Reminder:
         message: str,
         reminder_id: int = None,
         status: bool = True,
+        timezone: Optional[str] = None,
     ):
         self.user_id = user_id
         self.reminder_name = reminder_name
         self.time = time
-        # Auto-fill today's date when user doesn't specify, common use case
+        # Auto-fill today's date when user doesn't specify, common use case.
+        # "Today" is the owner's, reminder dates are wall-clock values in their timezone.
         if date == "":
-            self.date = datetime.now().date().strftime("%d/%m/%Y")
+            self.date = Account.local_now(timezone).strftime("%d/%m/%Y")
         else:
             self.date = date
         self.intervals = intervals
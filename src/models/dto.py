@@ -1,4 +1,7 @@
 from dataclasses import dataclass
+from enum import Enum
+from datetime import datetime
+from typing import List, Optional
 
 
 @dataclass
@@ -12,3 +15,54 @@ class ReminderInfo:
     name: str
     date: str
     time: str
+
+
+@dataclass
+class ReminderPage:
+    """
+    One dashboard page together with the number of reminders matching its filter,
+    so pagination needs a single query.
+    """
+
+    reminders: List[ReminderInfo]
+    total: int
+
+
+@dataclass
+class ChangeEvent:
+    """
+    One committed Reminder/Account write received from the eida_changes channel.
+    reminder_id, name and next_fire_at are only set for reminder changes.
+    A "resync" event (table "*", no user) follows every (re)connection of the listener.
+    """
+
+    table: str
+    kind: str
+    user_id: Optional[int] = None
+    reminder_id: Optional[int] = None
+    name: Optional[str] = None
+    next_fire_at: Optional[datetime] = None
+
+
+@dataclass
+class DeliveryTarget:
+    """
+    Where and how the reminders of a user are sent.
+    channel_id is None until the user's DM channel has been resolved once.
+    """
+
+    channel_id: Optional[int] = None
+    group_dms: bool = True
+
+
+class MutationOutcome(Enum):
+    """
+    Result of a single-statement reminder edit, telling the command which reply to send.
+    ERROR covers database failures.
+    """
+
+    OK = "ok"
+    NO_ACCOUNT = "no_account"
+    NO_REMINDER = "no_reminder"
+    CONFLICT = "conflict"
+    ERROR = "error"
@@ -1,9 +1,11 @@
 import discord
 import os
+import sys
+import asyncio
 from dotenv import load_dotenv
 import logging
 from src.Eida import bot
-from src.tasks import reminderTask
+from src.tasks import leaderTask
 
 # Load environment variables from .env file for secure token storage
 load_dotenv()
@@ -18,6 +20,10 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# psycopg's async connections cannot run on Windows' default Proactor event loop
+if sys.platform == "win32":
+    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
 
 @bot.event
 async def on_ready():
@@ -33,12 +39,12 @@ async def on_ready():
         synced_commands = await bot.tree.sync()
         logger.info(f"Synced {len(synced_commands)} commands.")
 
-        # Start reminder task only if not already running to avoid duplicates
-        if not reminderTask.check_reminders.is_running():
-            # Wait until next minute boundary for consistent reminder timing
-            await reminderTask.wait_until_next_minute()
-            reminderTask.check_reminders.start()
-            logger.info("Reminder task started")
+        # Join the leader election only once; the elected instance runs the reminder task
+        if not leaderTask.hold_leadership.is_running():
+            leaderTask.hold_leadership.start()
+            logger.info("Leader election started")
+        if leaderTask.METRICS_INTERVAL > 0 and not leaderTask.log_metrics.is_running():
+            leaderTask.log_metrics.start()
     except Exception as e:
         logger.error("An error with syncing commands has occurred: ", e)
 
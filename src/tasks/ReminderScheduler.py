@@ -0,0 +1,255 @@
+import math
+import time
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+from src.database.ReminderDAO import ReminderDAO
+from src.models.dto import ChangeEvent
+from src.tasks.TimingWheel import TimingWheel, MINUTES_PER_DAY
+
+logger = logging.getLogger(__name__)
+
+
+def _to_minute(fire_at: datetime) -> int:
+    """Epoch minute a reminder fires in, rounded up so it is never woken early."""
+    return math.ceil(fire_at.timestamp() / 60)
+
+
+def _from_minute(minute: int) -> datetime:
+    """UTC datetime at the start of an epoch minute."""
+    return datetime.fromtimestamp(minute * 60, timezone.utc)
+
+
+class ReminderScheduler:
+    """
+    Timing wheel of upcoming reminders that sleeps until the next minute with something due.
+    The wheel holds the next `days` days; each day entering the span is loaded lazily from
+    Postgres, and change events keep it current in between, so idle minutes cost no query.
+    """
+
+    def __init__(
+        self,
+        dispatch: Callable[[List[int]], Awaitable[Set[int]]],
+        days: int = 7,
+        retry_delay: float = 1.0,
+        retry_window: float = 300.0,
+        sweep_interval: float = 120.0,
+        worker_id: Optional[str] = None,
+    ):
+        # Sends the due reminders (and any other due in the database), returns the ids sent
+        self.dispatch = dispatch
+        self.days = days
+        # A due reminder the dispatch did not claim (clock skew, leased elsewhere) is retried
+        # every retry_delay seconds for up to retry_window seconds after its fire time
+        self.retry_delay = retry_delay
+        self.retry_window = retry_window
+        # Seconds between sweeps for imminent reminders missing from the wheel, a safety net
+        # for changes the feed never reports such as expired leases; a sweep also runs when
+        # a lease held elsewhere expires. Rows leased to worker_id count as unclaimed
+        self.sweep_interval = sweep_interval
+        self.worker_id = worker_id
+
+        self.wheel = TimingWheel(int(time.time() // 60), days)
+        self._wakeup = asyncio.Event()
+        self._running = False
+        self._reload_requested = True
+        # Change events received while a load query is in flight, replayed after it
+        self._buffered: Optional[List[ChangeEvent]] = None
+        # reminder_id -> minute it first became due, for unclaimed reminders being retried
+        self._retries: Dict[int, int] = {}
+        self._retry_at = math.inf
+        self._sweep_at = math.inf
+
+        self.fired = 0
+        self.loads = 0
+        self.sweeps = 0
+        self.swept = 0
+        self.last_lateness = 0.0
+        self.max_lateness = 0.0
+
+    def apply(self, event: ChangeEvent):
+        """Change feed subscriber: follow reminder inserts, edits, deletions and resyncs."""
+        if not self._running:
+            return
+        if self._buffered is not None:
+            self._buffered.append(event)
+        if event.kind == "resync":
+            # Events may have been missed while the feed was disconnected
+            self._reload_requested = True
+            self._wakeup.set()
+            return
+        if event.table != "reminder":
+            return
+        # The edit or completion supersedes any pending retry
+        self._retries.pop(event.reminder_id, None)
+
+        if event.next_fire_at is None:
+            # Deleted, paused or retired one-time reminder
+            self.wheel.cancel(event.reminder_id)
+            return
+        next_minute = self.wheel.next_minute()
+        minute = _to_minute(event.next_fire_at)
+        # Beyond the span it is loaded with its day instead
+        if self.wheel.schedule(event.reminder_id, minute):
+            if next_minute is None or minute < next_minute:
+                self._wakeup.set()
+
+    def requeue(self, reminder_ids: List[int]):
+        """Hand reminders found overdue outside the wheel to the next dispatch pass."""
+        if not self._running:
+            return
+        for reminder_id in reminder_ids:
+            if reminder_id not in self.wheel:
+                # Scheduled as overdue, so it is handed out right away
+                self.wheel.schedule(reminder_id, self.wheel.current)
+        self._wakeup.set()
+
+    async def reload(self):
+        """Rebuild the wheel from every reminder due within its span."""
+        self.wheel = TimingWheel(int(time.time() // 60), self.days)
+        await self._load(None, self.wheel.span_end)
+        self._reload_requested = False
+        # The reload already read everything overdue
+        await self._schedule_sweep()
+        logger.info(f"Scheduler wheel reloaded with {len(self.wheel)} reminders")
+
+    async def run(self):
+        """Fire reminders as they become due until cancelled."""
+        self._running = True
+        self._reload_requested = True
+        try:
+            while True:
+                # Cleared before peeking, so an apply() racing with the sleep is not lost
+                self._wakeup.clear()
+                if self._reload_requested:
+                    await self.reload()
+                    continue
+
+                now = time.time()
+                if now >= self._retry_at:
+                    for reminder_id in self._retries:
+                        if reminder_id not in self.wheel:
+                            # Scheduled as overdue, so it is handed out right away
+                            self.wheel.schedule(reminder_id, self.wheel.current)
+                    self._retry_at = math.inf
+                if now >= self._sweep_at:
+                    await self._sweep()
+                    continue
+
+                now_minute = int(now // 60)
+                if now_minute > self.wheel.current or self.wheel.has_overdue():
+                    await self._fire(now, now_minute)
+                    continue
+
+                # Wake for the next slot, and at least at midnight UTC to load the next day
+                next_minute = self.wheel.next_minute()
+                next_day = (now_minute // MINUTES_PER_DAY + 1) * MINUTES_PER_DAY
+                wake_minute = min(next_minute or next_day, next_day)
+                timeout = min(wake_minute * 60, self._retry_at, self._sweep_at) - now
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), max(timeout, 0))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._running = False
+
+    async def _fire(self, now: float, now_minute: int):
+        """Advance the wheel to the current minute and run one dispatch pass for what is due."""
+        span_end = self.wheel.span_end
+        due = self.wheel.advance(now_minute)
+        if self.wheel.span_end > span_end:
+            # Days that just entered the span
+            await self._load(span_end, self.wheel.span_end)
+        if not due:
+            return
+
+        # Seconds since the start of the minute the reminders were due in
+        self.last_lateness = now - now_minute * 60
+        self.max_lateness = max(self.max_lateness, self.last_lateness)
+        claimed = await self.dispatch(due)
+        self.fired += len(claimed)
+
+        # Next occurrences come back through the change feed once the batch is completed
+        retry = False
+        for reminder_id in due:
+            first_due = self._retries.pop(reminder_id, now_minute)
+            if reminder_id not in claimed and now - first_due * 60 < self.retry_window:
+                self._retries[reminder_id] = first_due
+                retry = True
+        if retry:
+            self._retry_at = min(self._retry_at, time.time() + self.retry_delay)
+
+    async def _sweep(self):
+        """
+        Add the reminders firing before the next sweep that the wheel lost track of,
+        overdue ones included, so they are sent on time.
+        """
+        end = math.ceil((time.time() + self.sweep_interval) / 60) + 1
+        missing = await self._load(None, end, missing_only=True)
+        if missing:
+            logger.warning(f"Sweep found {missing} reminders off the wheel")
+        self.sweeps += 1
+        self.swept += missing
+        await self._schedule_sweep()
+
+    async def _schedule_sweep(self):
+        """
+        Sweep again after sweep_interval, or as soon as a lease held elsewhere expires,
+        since the reminders it covered were left out of the wheel.
+        """
+        sweep_at = time.time() + self.sweep_interval
+        expiry = await ReminderDAO.get_next_lease_expiry(self.worker_id)
+        if expiry is not None:
+            # Never a busy loop, whatever the clock skew with Postgres
+            sweep_at = min(
+                sweep_at, max(expiry.timestamp() + 1, time.time() + self.retry_delay)
+            )
+        self._sweep_at = sweep_at
+
+    async def _load(
+        self, start: Optional[int], end: int, missing_only: bool = False
+    ) -> int:
+        """
+        Add the reminders firing in [start, end) minutes (everything before end if None),
+        only those absent from the wheel and not being retried if missing_only.
+        Returns the number of reminders added.
+        """
+        added = 0
+        self._buffered = []
+        try:
+            schedule = await ReminderDAO.get_fire_schedule(
+                _from_minute(end),
+                _from_minute(start) if start is not None else None,
+                self.worker_id,
+            )
+            for reminder_id, fire_at in schedule:
+                if missing_only and (
+                    reminder_id in self.wheel or reminder_id in self._retries
+                ):
+                    continue
+                self.wheel.schedule(reminder_id, _to_minute(fire_at))
+                added += 1
+            # Changes committed while the query ran may be missing from its result
+            buffered, self._buffered = self._buffered, None
+            for event in buffered:
+                self.apply(event)
+        finally:
+            self._buffered = None
+        self.loads += 1
+        return added
+
+    def stats(self) -> dict:
+        """Scheduler metrics: reminders held, wheel entries and how late they were fired."""
+        next_minute = self.wheel.next_minute()
+        return {
+            "scheduled": len(self.wheel),
+            "slot_entries": self.wheel.slot_entries(),
+            "next_fire_at": _from_minute(next_minute) if next_minute else None,
+            "fired": self.fired,
+            "loads": self.loads,
+            "sweeps": self.sweeps,
+            "swept": self.swept,
+            "last_lateness": self.last_lateness,
+            "max_lateness": self.max_lateness,
+        }
@@ -0,0 +1,69 @@
+import time
+import random
+import asyncio
+
+
+class SendShaper:
+    """
+    Token bucket in front of Discord sends: `rate` sends per second on average, bursts of up
+    to `burst` at once. A 429 pauses every sender until Discord's retry-after has passed,
+    so a rate limit is waited out once instead of being retried by each pending send.
+    """
+
+    def __init__(self, rate: float, burst: int, jitter: float = 0.0):
+        self.rate = rate
+        self.burst = burst
+        # Seconds a batch larger than the bucket is spread over before it starts draining it
+        self.jitter = jitter
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        # Waiters take tokens in arrival order, so a burst drains at the bucket's pace
+        self._lock = asyncio.Lock()
+
+        self.waited = 0.0
+        self.backoffs = 0
+
+    def spread_delay(self, batch_size: int) -> float:
+        """Random start offset for one send of a batch, zero when the bucket absorbs it."""
+        if batch_size <= self.burst or self.jitter <= 0:
+            return 0.0
+        return random.uniform(0, self.jitter)
+
+    async def acquire(self):
+        """Wait for a send token, and for any global backoff to end."""
+        began = time.monotonic()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._refilled_at) * self.rate
+                )
+                self._refilled_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    break
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+        self.waited += time.monotonic() - began
+
+    def backoff(self, retry_after: float):
+        """Pause all sends for retry_after seconds and empty the bucket after a 429."""
+        self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+        # Resume from an empty bucket so the limit is not hit again right away
+        self._tokens = 0.0
+        self._refilled_at = self._paused_until
+        self.backoffs += 1
+
+    def stats(self) -> dict:
+        """Shaper metrics: configured rate, seconds spent waiting for tokens and 429 backoffs."""
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "tokens": round(self._tokens, 2),
+            "paused": time.monotonic() < self._paused_until,
+            "waited": self.waited,
+            "backoffs": self.backoffs,
+        }
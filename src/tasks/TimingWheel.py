@@ -0,0 +1,162 @@
+from array import array
+from typing import Dict, List, Optional
+
+MINUTES_PER_HOUR = 60
+MINUTES_PER_DAY = 1440
+
+
+class TimingWheel:
+    """
+    Hierarchical timing wheel of reminder ids with minute, hour and day levels.
+    Times are whole epoch minutes (reminders never fire between minutes).
+    Insert and cancel are O(1); advancing one minute drains one slot and, on hour/day
+    boundaries, cascades one coarser slot down a level.
+    Only `days` whole days are held; later reminders are loaded by the caller as the span moves.
+    """
+
+    def __init__(self, current: int, days: int = 7):
+        # Last minute drained, every slot up to it has been handed out
+        self.current = current
+        self.days = days
+        # Slots only store ids as raw 64-bit integers; an entry is valid while
+        # _fire_minutes still maps its id to a minute inside the slot's range
+        self._minute_slots = [array("q") for _ in range(MINUTES_PER_HOUR)]
+        self._hour_slots = [array("q") for _ in range(24)]
+        self._day_slots = [array("q") for _ in range(days)]
+        self._fire_minutes: Dict[int, int] = {}
+        # Scheduled at or before the current minute, handed out by the next advance
+        self._overdue = array("q")
+
+    @property
+    def span_end(self) -> int:
+        """First minute not covered by the wheel, reminders from there on are not held."""
+        return (self.current // MINUTES_PER_DAY + self.days) * MINUTES_PER_DAY
+
+    def schedule(self, reminder_id: int, minute: int) -> bool:
+        """Insert or move a reminder. Returns False if it lies beyond the span (not held)."""
+        if minute >= self.span_end:
+            self._fire_minutes.pop(reminder_id, None)
+            return False
+        self._fire_minutes[reminder_id] = minute
+        self._place(reminder_id, minute, self.current + 1)
+        return True
+
+    def cancel(self, reminder_id: int):
+        """Forget a reminder, its slot entry is skipped when reached."""
+        self._fire_minutes.pop(reminder_id, None)
+
+    def has_overdue(self) -> bool:
+        """Whether reminders were scheduled at or before the current minute."""
+        return len(self._overdue) > 0
+
+    def advance(self, to_minute: int) -> List[int]:
+        """
+        Drain every minute up to to_minute (included) and return the ids that became due,
+        overdue ones included. Each id is returned once, its entry is then forgotten.
+        """
+        # An overdue id moved to a later minute meanwhile is found again in its new slot
+        due = self._collect(self._overdue, lambda minute: minute <= to_minute)
+        self._overdue = array("q")
+
+        while self.current < to_minute:
+            minute = self.current + 1
+            # Coarser slots are cascaded when their period starts, before draining the minute
+            if minute % MINUTES_PER_DAY == 0:
+                self._cascade(self._day_slots, minute, MINUTES_PER_DAY, self.days)
+            if minute % MINUTES_PER_HOUR == 0:
+                self._cascade(self._hour_slots, minute, MINUTES_PER_HOUR, 24)
+
+            index = minute % MINUTES_PER_HOUR
+            slot = self._minute_slots[index]
+            self._minute_slots[index] = array("q")
+            due.extend(self._collect(slot, lambda fire_minute: fire_minute == minute))
+            self.current = minute
+        return due
+
+    def next_minute(self) -> Optional[int]:
+        """
+        Earliest minute worth waking up for: the next non-empty minute slot of the current hour,
+        else the start of the next hour/day whose slot is non-empty. May be a false positive
+        when a slot only holds cancelled entries, never a false negative.
+        """
+        if self._overdue:
+            return self.current
+        # Slots are laid out relative to the next minute to drain, as in _place
+        ref = self.current + 1
+        # Coarse slots starting right at ref are not cascaded yet
+        if (
+            ref % MINUTES_PER_DAY == 0
+            and self._day_slots[(ref // MINUTES_PER_DAY) % self.days]
+        ):
+            return ref
+        if (
+            ref % MINUTES_PER_HOUR == 0
+            and self._hour_slots[(ref // MINUTES_PER_HOUR) % 24]
+        ):
+            return ref
+
+        hour_start = ref - ref % MINUTES_PER_HOUR
+        for minute in range(ref, hour_start + MINUTES_PER_HOUR):
+            if self._minute_slots[minute % MINUTES_PER_HOUR]:
+                return minute
+
+        day_start = ref - ref % MINUTES_PER_DAY
+        for hour_minute in range(
+            hour_start + MINUTES_PER_HOUR, day_start + MINUTES_PER_DAY, MINUTES_PER_HOUR
+        ):
+            if self._hour_slots[(hour_minute // MINUTES_PER_HOUR) % 24]:
+                return hour_minute
+
+        for day_minute in range(
+            day_start + MINUTES_PER_DAY, self.span_end, MINUTES_PER_DAY
+        ):
+            if self._day_slots[(day_minute // MINUTES_PER_DAY) % self.days]:
+                return day_minute
+        return None
+
+    def __len__(self) -> int:
+        return len(self._fire_minutes)
+
+    def __contains__(self, reminder_id: int) -> bool:
+        return reminder_id in self._fire_minutes
+
+    def slot_entries(self) -> int:
+        """Entries stored across all slots, cancelled ones included until they are reached."""
+        return len(self._overdue) + sum(
+            len(slot)
+            for slots in (self._minute_slots, self._hour_slots, self._day_slots)
+            for slot in slots
+        )
+
+    def _place(self, reminder_id: int, minute: int, ref: int):
+        """Append an id to the slot covering its minute, as seen from minute ref."""
+        if minute < ref:
+            self._overdue.append(reminder_id)
+        elif minute // MINUTES_PER_HOUR == ref // MINUTES_PER_HOUR:
+            self._minute_slots[minute % MINUTES_PER_HOUR].append(reminder_id)
+        elif minute // MINUTES_PER_DAY == ref // MINUTES_PER_DAY:
+            self._hour_slots[(minute // MINUTES_PER_HOUR) % 24].append(reminder_id)
+        else:
+            self._day_slots[(minute // MINUTES_PER_DAY) % self.days].append(reminder_id)
+
+    def _cascade(self, slots: List[array], start: int, period: int, count: int):
+        """Move the entries of the slot starting at `start` one level down."""
+        index = (start // period) % count
+        slot = slots[index]
+        slots[index] = array("q")
+        for reminder_id in slot:
+            minute = self._fire_minutes.get(reminder_id)
+            # Entries moved or cancelled since insertion are dropped here
+            if minute is not None and minute // period == start // period:
+                self._place(reminder_id, minute, start)
+
+    def _collect(self, slot: array, matches) -> List[int]:
+        """Pop the still-valid ids of a drained slot."""
+        due = []
+        for reminder_id in slot:
+            minute = self._fire_minutes.get(reminder_id)
+            if minute is not None and matches(minute):
+                # Popping also drops a duplicate entry of the same id in this slot
+                del self._fire_minutes[reminder_id]
+                due.append(reminder_id)
+        return due
@@ -0,0 +1,107 @@
+import os
+import json
+import inspect
+import logging
+from datetime import datetime
+from typing import Awaitable, Callable, List, Optional, Union
+import psycopg
+from psycopg import sql
+from discord.ext import tasks
+import src.database.PostgreSQLDB as psqldb
+from src.database.AccountDAO import AccountDAO
+from src.database.ReminderDAO import ReminderDAO
+from src.models.dto import ChangeEvent
+
+logger = logging.getLogger(__name__)
+
+# Channel the triggers of migration 0006 publish every Reminder/Account change on
+CHANGE_CHANNEL = "eida_changes"
+# Seconds before listening again after the connection was lost
+RECONNECT_DELAY = float(os.getenv("CHANGE_FEED_RECONNECT_DELAY", "5"))
+
+# Called with every ChangeEvent once local caches have been updated, e.g. by the dispatcher
+_subscribers: List[Callable[[ChangeEvent], Union[None, Awaitable[None]]]] = []
+events_received = 0
+connected_since: Optional[datetime] = None
+
+
+def subscribe(callback: Callable[[ChangeEvent], Union[None, Awaitable[None]]]):
+    """Register a (sync or async) callback notified of every change from any process."""
+    _subscribers.append(callback)
+
+
+@tasks.loop(seconds=RECONNECT_DELAY)
+async def listen_for_changes():
+    """
+    Apply changes committed by any bot process to this process' caches and subscribers.
+    Runs until the dedicated connection breaks, the loop then reconnects after RECONNECT_DELAY.
+    """
+    global connected_since
+    try:
+        connection = await psqldb.connect_dedicated()
+        async with connection:
+            await connection.execute(
+                sql.SQL("LISTEN {}").format(sql.Identifier(CHANGE_CHANNEL))
+            )
+            # Events sent while disconnected are lost, so start again from empty caches
+            AccountDAO.clear_cache()
+            ReminderDAO.clear_snapshots()
+            connected_since = datetime.now()
+            logger.info(f"Listening for changes on {CHANGE_CHANNEL}")
+            # Lets subscribers holding their own state (e.g. the scheduler) reload it too
+            await _publish(ChangeEvent(table="*", kind="resync"))
+
+            async for notify in connection.notifies():
+                await _apply(notify.payload)
+    except psycopg.Error as e:
+        logger.error(f"Change feed connection failed: {e}")
+    finally:
+        connected_since = None
+
+
+async def _apply(payload: str):
+    """Invalidate the cache entries a change touches, then hand it to the subscribers."""
+    global events_received
+    try:
+        data = json.loads(payload)
+        next_fire_at = data.get("next_fire_at")
+        event = ChangeEvent(
+            table=data["table"],
+            kind=data["kind"],
+            user_id=data["user_id"],
+            reminder_id=data.get("reminder_id"),
+            name=data.get("name"),
+            next_fire_at=datetime.fromisoformat(next_fire_at) if next_fire_at else None,
+        )
+    except (ValueError, KeyError) as e:
+        logger.error(f"Malformed change event {payload!r}: {e}")
+        return
+
+    events_received += 1
+    if event.table == "account":
+        AccountDAO.invalidate_account(event.user_id)
+    else:
+        ReminderDAO.invalidate_snapshot(event.user_id)
+    await _publish(event)
+
+
+async def _publish(event: ChangeEvent):
+    """Hand an event to every subscriber."""
+    for callback in _subscribers:
+        try:
+            result = callback(event)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            # One faulty subscriber must not stop the feed for the others
+            logger.error(f"Change feed subscriber {callback.__name__} failed: {e}")
+
+
+def change_feed_status() -> dict:
+    """Change feed metric for monitoring: whether it is connected and how many events it applied."""
+    return {
+        "listening": connected_since is not None,
+        "connected_since": connected_since,
+        "events_received": events_received,
+        "subscribers": len(_subscribers),
+    }
@@ -0,0 +1,127 @@
+import os
+import logging
+from datetime import datetime
+from typing import Optional
+import psycopg
+from discord.ext import tasks
+import src.database.PostgreSQLDB as psqldb
+from src.database.AccountDAO import AccountDAO
+from src.database.ReminderDAO import ReminderDAO
+from src.tasks import changeFeedTask, reminderTask
+
+logger = logging.getLogger(__name__)
+
+# Arbitrary constant shared by every bot instance competing for the scheduler
+LEADER_LOCK_KEY = 4_711_002
+# Seconds between election attempts, bounds how long a failover takes
+ELECTION_INTERVAL = float(os.getenv("LEADER_ELECTION_INTERVAL", "5"))
+# Seconds between metric log lines of this instance, 0 disables them
+METRICS_INTERVAL = float(os.getenv("METRICS_INTERVAL", "300"))
+
+# Dedicated session holding the advisory lock; the lock dies with it
+_connection: Optional[psycopg.AsyncConnection] = None
+is_leader = False
+leader_since: Optional[datetime] = None
+leadership_changes = 0
+
+
+@tasks.loop(seconds=ELECTION_INTERVAL)
+async def hold_leadership():
+    """
+    Keep exactly one instance running the reminder scheduler.
+    Standbys retry pg_try_advisory_lock every interval; the leader pings its session so a
+    broken connection (and therefore a lost lock) is noticed within one interval.
+    """
+    global _connection
+    try:
+        if _connection is None or _connection.closed:
+            _connection = await psqldb.connect_dedicated()
+
+        if is_leader:
+            # Session-level lock is held as long as this connection is alive
+            await _connection.execute("SELECT 1")
+            return
+
+        cursor = await _connection.execute(
+            "SELECT pg_try_advisory_lock(%s)", (LEADER_LOCK_KEY,)
+        )
+        if (await cursor.fetchone())[0]:
+            _become_leader()
+    except psycopg.Error as e:
+        logger.error(f"Leader election connection failed: {e}")
+        if is_leader:
+            _step_down()
+        if _connection is not None:
+            await _connection.close()
+        _connection = None
+
+
+def _become_leader():
+    """Start the scheduler once the advisory lock is acquired."""
+    global is_leader, leader_since, leadership_changes
+    is_leader = True
+    leader_since = datetime.now()
+    leadership_changes += 1
+    logger.info(f"Leadership acquired by {reminderTask.WORKER_ID}")
+    reminderTask.start_dispatcher()
+
+
+def _step_down():
+    """Stop the scheduler immediately, another instance may already hold the lock."""
+    global is_leader, leader_since, leadership_changes
+    is_leader = False
+    leader_since = None
+    leadership_changes += 1
+    logger.warning(f"Leadership lost by {reminderTask.WORKER_ID}")
+    reminderTask.stop_dispatcher()
+
+
+async def stop_election():
+    """
+    Leave the election on shutdown: stop the loops and the scheduler, then close the lock
+    session so another instance takes over without waiting for it to time out.
+    Must run while the pool is open, the dispatcher hands its leases back through it.
+    """
+    global _connection, is_leader, leader_since
+    hold_leadership.cancel()
+    log_metrics.cancel()
+    if is_leader:
+        is_leader = False
+        leader_since = None
+        logger.info(f"Leadership released by {reminderTask.WORKER_ID}")
+    reminderTask.stop_dispatcher()
+    await reminderTask.wait_for_background()
+    if _connection is not None:
+        await _connection.close()
+        _connection = None
+
+
+def leadership_status() -> dict:
+    """Leadership metric for monitoring: who this instance is and whether it runs the scheduler."""
+    return {
+        "worker_id": reminderTask.WORKER_ID,
+        "is_leader": is_leader,
+        "leader_since": leader_since,
+        "leadership_changes": leadership_changes,
+        "dispatcher_running": reminderTask.run_scheduler.is_running(),
+        "scheduler": reminderTask.scheduler.stats(),
+        "prefetch": reminderTask.prefetch_stats(),
+        "sends": reminderTask.send_stats(),
+    }
+
+
+def metrics() -> dict:
+    """Every metric of this instance: leadership and dispatcher, pool, caches and change feed."""
+    return {
+        "leadership": leadership_status(),
+        "pool": psqldb.pool_stats(),
+        "account_cache": AccountDAO.cache_stats(),
+        "snapshot_cache": ReminderDAO.snapshot_cache_stats(),
+        "change_feed": changeFeedTask.change_feed_status(),
+    }
+
+
+@tasks.loop(seconds=max(METRICS_INTERVAL, 1))
+async def log_metrics():
+    """Log this instance's metrics periodically, so they can be followed in bot.log."""
+    logger.info(f"Metrics: {metrics()}")
@@ -1,64 +1,554 @@
-import logging
+import os
+import time
+import socket
 import asyncio
-from datetime import datetime
+import logging
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set, Tuple
 import discord
 from discord.ext import tasks
+from src.database.AccountDAO import AccountDAO
 from src.database.ReminderDAO import ReminderDAO
 from src.models.Reminder import Reminder
+from src.models.dto import ChangeEvent, DeliveryTarget
+from src.tasks import changeFeedTask
+from src.tasks.ReminderScheduler import ReminderScheduler
+from src.tasks.SendShaper import SendShaper
 from src.Eida import bot
 
 logger = logging.getLogger(__name__)
 
+# Identifies this process' leases so several dispatchers can share the reminder table
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+# Holds the leases of missed reminders while they are caught up, so the scheduler skips them
+CATCHUP_WORKER_ID = f"{WORKER_ID}:catchup"
+# Reminders leased per claim, bounds memory and how much work a crashed worker strands
+BATCH_SIZE = int(os.getenv("REMINDER_BATCH_SIZE", "100"))
+# Seconds before an unfinished claim is handed to another worker
+LEASE_SECONDS = int(os.getenv("REMINDER_LEASE_SECONDS", "300"))
+
+# Days of upcoming reminders held in the scheduler's timing wheel, later ones are loaded lazily
+SCHEDULER_DAYS = int(os.getenv("SCHEDULER_DAYS", "7"))
+# Seconds before a crashed scheduler loop is restarted
+SCHEDULER_RESTART_DELAY = float(os.getenv("SCHEDULER_RESTART_DELAY", "5"))
+# Seconds between the scheduler's sweeps for due reminders it was never told about
+SCHEDULER_SWEEP_INTERVAL = float(os.getenv("SCHEDULER_SWEEP_INTERVAL", "120"))
+
+# What to do at startup with reminders missed while no scheduler was running:
+# "once" sends each one once, "all" once per missed occurrence, "skip" sends nothing.
+# Recurring reminders are then moved to their next occurrence after now in every case.
+CATCHUP_POLICY = os.getenv("REMINDER_CATCHUP_POLICY", "once")
+# Seconds late a reminder must be to count as missed, later ones are sent as usual
+CATCHUP_GRACE = float(os.getenv("REMINDER_CATCHUP_GRACE", "60"))
+# Messages sent at most per reminder under the "all" policy
+CATCHUP_MAX_OCCURRENCES = int(os.getenv("REMINDER_CATCHUP_MAX_OCCURRENCES", "10"))
+
+# Minutes of upcoming reminders leased and held in memory ahead of their fire time
+PREFETCH_MINUTES = float(os.getenv("REMINDER_PREFETCH_MINUTES", "5"))
+# Seconds between background refills of the prefetch buffer
+PREFETCH_INTERVAL = float(os.getenv("REMINDER_PREFETCH_INTERVAL", "60"))
+# Most reminders held in the buffer, the rest are claimed when due
+PREFETCH_LIMIT = int(os.getenv("REMINDER_PREFETCH_LIMIT", "10000"))
+# Seconds a due prefetched reminder may take to be sent and completed
+PREFETCH_SEND_SECONDS = float(os.getenv("REMINDER_PREFETCH_SEND_SECONDS", "60"))
+# Every refill renews the leases of buffered reminders, so they only need to outlive a missed
+# refill and the send; a crashed leader's buffer is then claimable again within minutes
+PREFETCH_LEASE_SECONDS = int(2 * PREFETCH_INTERVAL + PREFETCH_SEND_SECONDS)
+
+# DMs in flight at once; wall time then follows Discord's rate limit, not reminders x RTT
+SEND_CONCURRENCY = int(os.getenv("REMINDER_SEND_CONCURRENCY", "20"))
+# Longest message content Discord accepts
+MESSAGE_LIMIT = 2000
+# Sustained DMs per second, kept under Discord's global limit of 50 requests per second
+# to leave room for resolving the DM channel of first-time recipients
+SEND_RATE = float(os.getenv("REMINDER_SEND_RATE", "20"))
+# DMs sent back to back before the rate applies
+SEND_BURST = int(os.getenv("REMINDER_SEND_BURST", "20"))
+# Seconds a top-of-minute burst larger than SEND_BURST is spread over
+SEND_JITTER = float(os.getenv("REMINDER_SEND_JITTER", "3"))
+# Attempts per DM when Discord answers 429 despite the shaper
+SEND_ATTEMPTS = int(os.getenv("REMINDER_SEND_ATTEMPTS", "3"))
+# Recent send latencies kept for the percentiles reported by send_stats()
+LATENCY_SAMPLES = 1000
 
-@tasks.loop(minutes=1)
-async def check_reminders():
+# reminder_id -> (fire time, Reminder) leased ahead of time, sent without a query when due
+_prefetched: Dict[int, Tuple[datetime, Reminder]] = {}
+# Reminders being sent and completed right now
+_in_flight: Set[int] = set()
+# Ids sent or edited while a refill query runs, its rows for them may be outdated
+_touched_during_refill: Optional[Set[int]] = None
+_refill_lock = asyncio.Lock()
+_refill_pending = False
+# Strong references to background refills, asyncio only keeps weak ones
+_background_tasks = set()
+# Catch-up of missed reminders running alongside the scheduler
+_catch_up_task: Optional[asyncio.Task] = None
+
+_send_semaphore = asyncio.Semaphore(SEND_CONCURRENCY)
+shaper = SendShaper(SEND_RATE, SEND_BURST, SEND_JITTER)
+_send_latencies = deque(maxlen=LATENCY_SAMPLES)
+sends_delivered = 0
+sends_failed = 0
+max_send_latency = 0.0
+
+
+async def dispatch_due_reminders(due_ids: List[int]) -> Set[int]:
     """
-    Check for due reminders every minute and process them.
-    1-minute interval ensures reminders are sent promptly without excessive database queries.
+    Send the reminders the scheduler found due. Prefetched ones go out straight from memory,
+    only reminders missing from the buffer are claimed from Postgres first.
+    Returns the ids sent by this pass.
     """
+    now = datetime.now(timezone.utc)
+    ready = []
+    for reminder_id in due_ids:
+        entry = _prefetched.get(reminder_id)
+        # A later fire time means an edit the scheduler has not seen yet
+        if entry is not None and entry[0] <= now:
+            del _prefetched[reminder_id]
+            ready.append(entry[1])
+    sent = {reminder.reminder_id for reminder in ready}
+    await _send_and_complete(ready)
+
+    if len(ready) < len(due_ids):
+        # Edited since the last refill, or beyond the buffer limit
+        sent |= await _claim_and_send_due()
+    return sent
+
+
+async def _claim_and_send_due() -> Set[int]:
+    """Claim, send and complete every reminder due right now, batch by batch."""
+    sent = set()
     try:
-        now = datetime.now()
-        due_reminders = ReminderDAO.get_due_reminders(now)
-
-        logger.info(f"Found {len(due_reminders)} due reminders")
-        for reminder in due_reminders:
-            await send_reminder_to_user(reminder)
-            # Update recurring reminders to their next occurrence after successful send
-            if reminder.intervals:
-                ReminderDAO.update_reminder_date_time(reminder)
+        # Drain due reminders batch by batch; other dispatchers skip the rows leased here
+        while True:
+            due_reminders = await ReminderDAO.claim_due_reminders(
+                WORKER_ID, BATCH_SIZE, LEASE_SECONDS
+            )
+            logger.info(f"Found {len(due_reminders)} due reminders")
+            sent.update(reminder.reminder_id for reminder in due_reminders)
+            completed = await _send_and_complete(due_reminders)
+
+            if len(due_reminders) < BATCH_SIZE:
+                break
+            if not completed:
+                # Still leased to this worker, the next claim would send the same batch again
+                logger.error(
+                    "No claimed reminder could be completed, stopping this pass"
+                )
+                break
     except Exception as e:
-        logger.error(f"Error checking reminders: {e}")
+        logger.error(f"Error dispatching reminders: {e}")
+    return sent
+
+
+async def _send_and_complete(
+    reminders: List[Reminder], worker_id: str = WORKER_ID
+) -> Set[int]:
+    """
+    Send reminders leased to worker_id, then release the leases and reschedule them
+    in one round trip. Returns the ids completed.
+    """
+    if not reminders:
+        return set()
+    reminder_ids = [reminder.reminder_id for reminder in reminders]
+    for reminder_id in reminder_ids:
+        # Claimed again by the fallback, the buffered copy is outdated
+        _prefetched.pop(reminder_id, None)
+    # A refill running meanwhile may still read these rows as pending
+    _in_flight.update(reminder_ids)
+    if _touched_during_refill is not None:
+        _touched_during_refill.update(reminder_ids)
+    try:
+        by_user: Dict[int, List[Reminder]] = {}
+        for reminder in reminders:
+            by_user.setdefault(reminder.user_id, []).append(reminder)
+        targets = await AccountDAO.get_delivery_targets(by_user)
+        await asyncio.gather(
+            *(
+                _send_bounded(
+                    user_id,
+                    _render_messages(user_reminders, targets.get(user_id)),
+                    targets.get(user_id, DeliveryTarget()).channel_id,
+                    shaper.spread_delay(len(by_user)),
+                )
+                for user_id, user_reminders in by_user.items()
+            )
+        )
+
+        results = await ReminderDAO.complete_reminders(worker_id, reminder_ids)
+        for reminder in reminders:
+            if not results.get(reminder.reminder_id):
+                logger.warning(
+                    f"Lease lost before completing reminder {reminder.reminder_name}"
+                )
+    finally:
+        _in_flight.difference_update(reminder_ids)
+    return {reminder_id for reminder_id, completed in results.items() if completed}
+
+
+def _render_messages(
+    reminders: List[Reminder], target: Optional[DeliveryTarget]
+) -> List[str]:
+    """
+    DM contents for the reminders of one user due together: one per reminder, or the
+    reminders bundled under their names into as few messages as Discord accepts.
+    """
+    if len(reminders) == 1 or target is None or not target.group_dms:
+        return [reminder.message for reminder in reminders]
+
+    messages = []
+    current = ""
+    for reminder in reminders:
+        part = f"**{reminder.reminder_name}**\n{reminder.message}"
+        if current and len(current) + len(part) + 2 > MESSAGE_LIMIT:
+            messages.append(current)
+            current = ""
+        current = f"{current}\n\n{part}" if current else part
+    messages.append(current)
+    return messages
 
 
-async def send_reminder_to_user(reminder: Reminder):
+async def _send_bounded(
+    user_id: int, messages: List[str], channel_id: Optional[int], delay: float = 0.0
+):
     """
-    Send reminder message to user via DM.
+    Send one user's DMs in order once a concurrency slot is free,
+    recording the latency and outcome of each.
+    """
+    global sends_delivered, sends_failed, max_send_latency
+    if delay:
+        await asyncio.sleep(delay)
+    async with _send_semaphore:
+        for content in messages:
+            began = time.perf_counter()
+            delivered = await send_dm(user_id, content, channel_id)
+            latency = time.perf_counter() - began
+
+            _send_latencies.append(latency)
+            max_send_latency = max(max_send_latency, latency)
+            if delivered:
+                sends_delivered += 1
+            else:
+                sends_failed += 1
+
+
+async def refill_prefetch():
+    """
+    Lease every reminder due within the look-ahead window and add it to the buffer.
+    Leases of buffered reminders are extended on every refill.
+    """
+    global _touched_during_refill
+    async with _refill_lock:
+        _touched_during_refill = set(_in_flight)
+        try:
+            rows = await ReminderDAO.prefetch_reminders(
+                WORKER_ID,
+                PREFETCH_MINUTES * 60,
+                PREFETCH_LIMIT,
+                PREFETCH_LEASE_SECONDS,
+            )
+            # Rows sent or edited while the query ran may be older than what we know
+            for fire_at, reminder in rows:
+                if reminder.reminder_id not in _touched_during_refill:
+                    _prefetched[reminder.reminder_id] = (fire_at, reminder)
+        finally:
+            _touched_during_refill = None
+        # Warm the delivery cache too, so the send path finds every channel in memory
+        await AccountDAO.get_delivery_targets(reminder.user_id for _, reminder in rows)
+
+
+@tasks.loop(seconds=PREFETCH_INTERVAL)
+async def prefetch_upcoming():
     """
+    Keep the prefetch buffer filled in the background.
+    Skipped while the scheduler has nothing due within the window, so idle minutes stay free.
+    Buffered reminders already due but missing from the wheel are handed back to it.
+    """
+    now = datetime.now(timezone.utc)
+    overdue = [
+        reminder_id
+        for reminder_id, (fire_at, _) in _prefetched.items()
+        if fire_at <= now
+        and reminder_id not in _in_flight
+        and reminder_id not in scheduler.wheel
+    ]
+    if overdue:
+        logger.warning(f"Requeueing {len(overdue)} overdue prefetched reminders")
+        scheduler.requeue(overdue)
+
+    next_minute = scheduler.wheel.next_minute()
+    if next_minute is None or next_minute * 60 > time.time() + PREFETCH_MINUTES * 60:
+        return
     try:
-        user = await bot.fetch_user(reminder.user_id)
-        if user:
-            await user.send(reminder.message)
-            logger.info(f"Reminder sent to {user.name} ({user.id})")
-        else:
-            logger.warning(f"User {reminder.user_id} not found")
-    except discord.NotFound:
-        # User account deleted or invalid ID - permanent failure
-        logger.error(f"User {reminder.user_id} not found")
-    except discord.Forbidden:
-        # User has DMs disabled or blocked bot - expected behavior, not critical
-        logger.error(f"Cannot send DM to user {reminder.user_id}")
+        await refill_prefetch()
     except Exception as e:
-        # Unexpected errors that might indicate system issues
-        logger.error(f"Error sending reminder to {reminder.user_id}: {e}")
+        logger.error(f"Error prefetching reminders: {e}")
+
+
+def on_reminder_change(event: ChangeEvent):
+    """Reconcile the prefetch buffer with edits made by any process."""
+    if not prefetch_upcoming.is_running():
+        return
+    if event.kind == "resync":
+        # Edits may have been missed, refetch everything
+        _prefetched.clear()
+        _request_refill()
+        return
+    if event.table != "reminder":
+        return
+
+    if _touched_during_refill is not None:
+        _touched_during_refill.add(event.reminder_id)
+    _prefetched.pop(event.reminder_id, None)
+    if event.next_fire_at is not None:
+        seconds_ahead = event.next_fire_at.timestamp() - time.time()
+        if seconds_ahead <= PREFETCH_MINUTES * 60:
+            _request_refill()
+
+
+def _request_refill():
+    """Refill the buffer soon, coalescing bursts of edits into one query."""
+    global _refill_pending
+    if _refill_pending:
+        return
+    _refill_pending = True
+
+    async def refill():
+        global _refill_pending
+        _refill_pending = False
+        try:
+            await refill_prefetch()
+        except Exception as e:
+            logger.error(f"Error prefetching reminders: {e}")
+
+    _run_in_background(refill())
+
 
+def _run_in_background(coroutine):
+    """Start a task and keep a reference to it until it finishes."""
+    task = asyncio.create_task(coroutine)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
 
-async def wait_until_next_minute():
+
+# Wakes up on the minute the next reminder is due; edits reach it through the change feed.
+# Unclaimed reminders are retried for as long as a prefetch lease another worker may hold.
+scheduler = ReminderScheduler(
+    dispatch_due_reminders,
+    SCHEDULER_DAYS,
+    retry_window=PREFETCH_LEASE_SECONDS,
+    sweep_interval=SCHEDULER_SWEEP_INTERVAL,
+    worker_id=WORKER_ID,
+)
+changeFeedTask.subscribe(scheduler.apply)
+changeFeedTask.subscribe(on_reminder_change)
+
+
+@tasks.loop(seconds=SCHEDULER_RESTART_DELAY)
+async def run_scheduler():
+    """
+    Run the reminder scheduler; it only returns on failure, the loop then restarts it.
+    Claims are leased, so a failover never double-sends even if two schedulers overlap.
+    """
+    try:
+        await scheduler.run()
+    except Exception as e:
+        logger.error(f"Reminder scheduler failed: {e}")
+
+
+@run_scheduler.before_loop
+async def reserve_missed_reminders():
+    """
+    Lease every reminder missed before this instance took over to the catch-up in one
+    statement, then catch them up in the background while the scheduler runs.
+    Runs each time the scheduler starts, so due reminders are never held up by an outage.
+    """
+    global _catch_up_task
+    before = datetime.now(timezone.utc) - timedelta(seconds=CATCHUP_GRACE)
+    reserved = await ReminderDAO.reserve_missed_reminders(
+        CATCHUP_WORKER_ID, before, LEASE_SECONDS
+    )
+    if reserved:
+        logger.info(f"Catching up {reserved} missed reminders")
+        _catch_up_task = asyncio.create_task(catch_up_missed_reminders(before))
+
+
+async def catch_up_missed_reminders(before: datetime):
+    """
+    Apply the catch-up policy to the reminders missed before `before`, in leased batches
+    so a long outage is recovered in bounded memory.
+    """
+    policy = CATCHUP_POLICY
+    if policy not in ("once", "all", "skip"):
+        logger.warning(f"Unknown catch-up policy {policy!r}, using 'once'")
+        policy = "once"
+    max_occurrences = CATCHUP_MAX_OCCURRENCES if policy == "all" else 1
+
+    caught_up = 0
+    renew_at = time.monotonic() + LEASE_SECONDS / 2
+    try:
+        while True:
+            if time.monotonic() >= renew_at:
+                # Keep the reminders not reached yet away from the scheduler
+                await ReminderDAO.reserve_missed_reminders(
+                    CATCHUP_WORKER_ID, before, LEASE_SECONDS
+                )
+                renew_at = time.monotonic() + LEASE_SECONDS / 2
+            missed = await ReminderDAO.claim_missed_reminders(
+                CATCHUP_WORKER_ID, before, BATCH_SIZE, LEASE_SECONDS, max_occurrences
+            )
+            if policy == "skip":
+                results = await ReminderDAO.complete_reminders(
+                    CATCHUP_WORKER_ID, [reminder.reminder_id for reminder, _ in missed]
+                )
+                completed = {
+                    reminder_id for reminder_id, done in results.items() if done
+                }
+            else:
+                # One copy per missed occurrence, bundled per user like simultaneous reminders
+                completed = await _send_and_complete(
+                    [reminder for reminder, count in missed for _ in range(count)],
+                    CATCHUP_WORKER_ID,
+                )
+            caught_up += len(completed)
+
+            if len(missed) < BATCH_SIZE:
+                break
+            if not completed:
+                # Still leased to the catch-up, the next claim would return the same batch
+                logger.error("No missed reminder could be completed, stopping catch-up")
+                break
+    except Exception as e:
+        logger.error(f"Error catching up missed reminders: {e}")
+    if caught_up:
+        logger.info(f"Caught up {caught_up} missed reminders with policy '{policy}'")
+
+
+async def send_dm(user_id: int, content: str, channel_id: Optional[int] = None) -> bool:
     """
-    Synchronize task startup to minute boundaries for consistent reminder timing.
-    Prevents reminders from being delayed by bot restart timing.
+    Send a reminder DM, pacing requests through the shaper.
+    With a known DM channel this is a single REST call, otherwise the channel is resolved
+    and saved for the next reminders. Returns whether it was delivered.
     """
-    now = datetime.now()
-    second_to_wait = 60 - now.second
-    logger.info("Waiting until next minute...")
-    await asyncio.sleep(second_to_wait)
-    logger.info(f"Next minute reached -> {datetime.now()}")
+    for attempt in range(SEND_ATTEMPTS):
+        await shaper.acquire()
+        known_channel = channel_id is not None
+        try:
+            if channel_id is None:
+                channel_id = await _open_dm_channel(user_id)
+            await bot.get_partial_messageable(
+                channel_id, type=discord.ChannelType.private
+            ).send(content)
+            logger.info(f"Reminder sent to user {user_id}")
+            return True
+        except discord.NotFound:
+            if known_channel:
+                # The saved channel is gone, resolve a fresh one
+                await AccountDAO.set_dm_channel(user_id, None)
+                channel_id = None
+                continue
+            # User account deleted or invalid ID - permanent failure
+            logger.error(f"User {user_id} not found")
+            return False
+        except discord.Forbidden:
+            # User has DMs disabled or blocked bot - expected behavior, not critical
+            logger.error(f"Cannot send DM to user {user_id}")
+            if known_channel:
+                await AccountDAO.set_dm_channel(user_id, None)
+            return False
+        except discord.RateLimited as e:
+            # discord.py gave up waiting on its own, every sender backs off instead
+            shaper.backoff(e.retry_after)
+            logger.warning(f"Rate limited, pausing sends for {e.retry_after:.1f}s")
+        except discord.HTTPException as e:
+            if e.status != 429:
+                logger.error(f"Error sending reminder to {user_id}: {e}")
+                return False
+            retry_after = float(e.response.headers.get("Retry-After", 1))
+            shaper.backoff(retry_after)
+            logger.warning(f"Rate limited, pausing sends for {retry_after:.1f}s")
+        except Exception as e:
+            # Unexpected errors that might indicate system issues
+            logger.error(f"Error sending reminder to {user_id}: {e}")
+            return False
+    logger.error(
+        f"Giving up on a reminder DM to {user_id} after {SEND_ATTEMPTS} attempts"
+    )
+    return False
+
+
+async def _open_dm_channel(user_id: int) -> int:
+    """
+    Resolve a user's DM channel, from the gateway cache when the user shares a guild,
+    and save its id. Raises discord.NotFound for unknown users.
+    """
+    user = bot.get_user(user_id) or await bot.fetch_user(user_id)
+    channel = user.dm_channel or await user.create_dm()
+    await AccountDAO.set_dm_channel(user_id, channel.id)
+    return channel.id
+
+
+def start_dispatcher():
+    """
+    Start the reminder scheduler and its prefetch unless they already run.
+    Called by the leader election once this instance owns the scheduler.
+    """
+    if not run_scheduler.is_running():
+        run_scheduler.start()
+        logger.info("Reminder scheduler started")
+    if not prefetch_upcoming.is_running():
+        prefetch_upcoming.start()
+
+
+def stop_dispatcher():
+    """
+    Stop the reminder scheduler right away, used when leadership is lost.
+    Prefetched leases are handed back; those of an interrupted batch simply expire.
+    """
+    if run_scheduler.is_running():
+        run_scheduler.cancel()
+        logger.info("Reminder scheduler stopped")
+    if _catch_up_task is not None and not _catch_up_task.done():
+        # Its leases are handed back, the next leader catches these reminders up
+        _catch_up_task.cancel()
+        _run_in_background(ReminderDAO.release_claims(CATCHUP_WORKER_ID))
+    if prefetch_upcoming.is_running():
+        prefetch_upcoming.cancel()
+        _prefetched.clear()
+        _run_in_background(ReminderDAO.release_claims(WORKER_ID))
+
+
+async def wait_for_background():
+    """Wait for the background work started so far, lease hand-backs included, to finish."""
+    await asyncio.gather(*_background_tasks, return_exceptions=True)
+
+
+def prefetch_stats() -> dict:
+    """Prefetch buffer metrics for monitoring."""
+    return {
+        "prefetched": len(_prefetched),
+        "in_flight": len(_in_flight),
+        "window_minutes": PREFETCH_MINUTES,
+    }
+
+
+def send_stats() -> dict:
+    """DM dispatch metrics: outcomes and latency of recent sends, in seconds."""
+    latencies = sorted(_send_latencies)
+
+    def percentile(fraction: float) -> Optional[float]:
+        if not latencies:
+            return None
+        return latencies[min(int(len(latencies) * fraction), len(latencies) - 1)]
+
+    return {
+        "concurrency": SEND_CONCURRENCY,
+        "shaper": shaper.stats(),
+        "delivery_cache": AccountDAO.delivery_cache_stats(),
+        "delivered": sends_delivered,
+        "failed": sends_failed,
+        "p50_latency": percentile(0.5),
+        "p95_latency": percentile(0.95),
+        "max_latency": max_send_latency,
+    }
@@ -11,20 +11,11 @@ class DashboardView(discord.ui.View):
     def __init__(self, discord_uid: int, activity: bool = None):
         super().__init__(timeout=None)
         self.page = 0
-
-        # Query different counts based on activity filter to calculate accurate pagination
-        if activity is None:
-            reminder_count = ReminderDAO.get_reminder_count(discord_uid=discord_uid)
-        else:
-            reminder_count = ReminderDAO.get_reminder_count_by_activity(
-                discord_uid=discord_uid, activity=activity
-            )
-
-        # Ensure at least 1 page exists even with no reminders for consistent UI
-        self.total_pages = (
-            int(ceil(reminder_count / PAGE_SIZE)) if reminder_count > 0 else 1
-        )
-
+        # Refreshed from the reminder total returned with every page
+        self.total_pages = 1
+        # Names at both ends of the displayed page, used as keyset cursors by prev/next
+        self.first_name = None
+        self.last_name = None
         self.discord_uid = discord_uid
         self.activity = activity
         self.update_buttons()
@@ -42,37 +33,45 @@ class DashboardView(discord.ui.View):
                 elif item.custom_id == "last":
                     item.disabled = self.page >= self.total_pages - 1
 
-    def get_current_page_info(self):
-        """Retrieve the list of reminders for the current page."""
-        content = self.get_content_from_db(self.page + 1)
+    async def get_current_page_info(
+        self, after: str = None, before: str = None, last: bool = False
+    ):
+        """Retrieve the list of reminders for the page reached from the given cursor."""
+        content = await self.get_content_from_db(after=after, before=before, last=last)
         if content == "No content":
             return content, 0, 0
         return content, self.page + 1, self.total_pages
 
-    def get_content_from_db(self, current_page: int):
+    async def get_content_from_db(
+        self, after: str = None, before: str = None, last: bool = False
+    ):
         """
-        Fetch reminders for display, using different queries based on activity filter.
+        Fetch reminders for display by seeking from the current page boundaries.
         Three-way activity filter allows showing all, active only, or inactive only.
+        The same query returns the reminder total, keeping the page count up to date.
         """
-        if self.activity is None:
-            # Show all reminders regardless of active status
-            reminders = ReminderDAO.get_reminders_by_offset(
-                self.discord_uid, (current_page - 1) * PAGE_SIZE, PAGE_SIZE
-            )
-        elif self.activity is True:
-            # Show only active reminders
-            reminders = ReminderDAO.get_reminders_by_offset_activity(
-                self.discord_uid, (current_page - 1) * PAGE_SIZE, PAGE_SIZE, True
-            )
-        elif self.activity is False:
-            # Show only inactive reminders
-            reminders = ReminderDAO.get_reminders_by_offset_activity(
-                self.discord_uid, (current_page - 1) * PAGE_SIZE, PAGE_SIZE, False
-            )
+        page = await ReminderDAO.get_reminders_page(
+            self.discord_uid,
+            PAGE_SIZE,
+            activity=self.activity,
+            after=after,
+            before=before,
+            last=last,
+        )
+
+        # Ensure at least 1 page exists even with no reminders for consistent UI
+        self.total_pages = int(ceil(page.total / PAGE_SIZE)) if page.total > 0 else 1
+        # Reminders may have been deleted since the previous page was shown
+        self.page = min(self.page, self.total_pages - 1)
+        self.update_buttons()
+
+        if page.reminders:
+            self.first_name = page.reminders[0].name
+            self.last_name = page.reminders[-1].name
 
         content = ""
-        for reminder in reminders:
-            content += f"{"✅" if reminder.is_active else "❌"} - {reminder.name} | {reminder.date} | {reminder.time}\n"
+        for reminder in page.reminders:
+            content += f"{'✅' if reminder.is_active else '❌'} - {reminder.name} | {reminder.date} | {reminder.time}\n"
 
         return content if content else "No content"
 
@@ -85,7 +84,7 @@ class DashboardView(discord.ui.View):
         if self.page != 0:
             self.page = 0
             self.update_buttons()
-            content, current, total = self.get_current_page_info()
+            content, current, total = await self.get_current_page_info()
             embed = discord.Embed(title=f"{interaction.user.name}", description=content)
             embed.set_footer(text=f"Page {current}/{total}")
             await interaction.response.edit_message(embed=embed, view=self)
@@ -97,7 +96,9 @@ class DashboardView(discord.ui.View):
         if self.page > 0:
             self.page -= 1
             self.update_buttons()
-            content, current, total = self.get_current_page_info()
+            content, current, total = await self.get_current_page_info(
+                before=self.first_name
+            )
             embed = discord.Embed(title=f"{interaction.user.name}", description=content)
             embed.set_footer(text=f"Page {current}/{total}")
             await interaction.response.edit_message(embed=embed, view=self)
@@ -109,12 +110,16 @@ class DashboardView(discord.ui.View):
         if self.page < self.total_pages - 1:
             self.page += 1
             self.update_buttons()
-            content, current, total = self.get_current_page_info()
+            content, current, total = await self.get_current_page_info(
+                after=self.last_name
+            )
             embed = discord.Embed(title=f"{interaction.user.name}", description=content)
             embed.set_footer(text=f"Page {current}/{total}")
             await interaction.response.edit_message(embed=embed, view=self)
 
-    @discord.ui.button(label="⏭️", style=discord.ButtonStyle.secondary, custom_id="last")
+    @discord.ui.button(
+        label="⏭️", style=discord.ButtonStyle.secondary, custom_id="last"
+    )
     async def last_button(
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
@@ -122,7 +127,7 @@ class DashboardView(discord.ui.View):
         if self.page != last_page:
             self.page = last_page
             self.update_buttons()
-            content, current, total = self.get_current_page_info()
+            content, current, total = await self.get_current_page_info(last=True)
             embed = discord.Embed(title=f"{interaction.user.name}", description=content)
             embed.set_footer(text=f"Page {current}/{total}")
             await interaction.response.edit_message(embed=embed, view=self)
@@ -0,0 +1,44 @@
+import os
+import sys
+import asyncio
+import pytest
+import psycopg
+
+# Tests import the bot's modules as src.*, like `python -m src.server` run from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Database tests run against a scratch database of their own, never the bot's one from .env.
+# Set before PostgreSQLDB is imported, as load_dotenv() does not override the environment.
+TEST_DBNAME = os.getenv("TEST_DBNAME")
+if TEST_DBNAME:
+    os.environ["DBNAME"] = TEST_DBNAME
+
+import src.database.PostgreSQLDB as psqldb
+from src.database.Migrator import Migrator
+
+
+async def _migrate():
+    await psqldb.open_pool()
+    try:
+        await Migrator.migrate()
+    finally:
+        await psqldb.close_pool()
+
+
+@pytest.fixture(scope="session")
+def migrated_database():
+    """
+    TEST_DBNAME database with every migration applied, on the server and credentials of .env.
+    Tests needing Postgres are skipped when it is not set.
+    """
+    if not TEST_DBNAME:
+        pytest.skip("No test database configured (TEST_DBNAME)")
+    asyncio.run(_migrate())
+
+
+@pytest.fixture
+def db_connection(migrated_database):
+    """Connection in a transaction rolled back after the test, so seeded rows never persist."""
+    with psycopg.connect(**psqldb.CONNECTION_KWARGS) as connection:
+        yield connection
+        connection.rollback()
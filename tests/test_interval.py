@@ -0,0 +1,108 @@
+import random
+from datetime import datetime, time, timedelta
+import pytest
+from src.models.Interval import Interval, WEEKDAYS
+
+SEED = 20240101
+CASES = 2000
+
+
+def step_occurrence_after(
+    interval: Interval, current: datetime, after: datetime
+) -> datetime:
+    """Reference: walk occurrence by occurrence from current until strictly after `after`."""
+    if interval.period_seconds:
+        occurrence = current + timedelta(seconds=interval.period_seconds)
+        while occurrence <= after:
+            occurrence += timedelta(seconds=interval.period_seconds)
+        return occurrence
+
+    occurrence = datetime.combine(
+        current.date() + timedelta(days=1), time(current.hour, current.minute)
+    )
+    while not (
+        interval.weekday_mask >> occurrence.weekday() & 1 and occurrence > after
+    ):
+        occurrence += timedelta(days=1)
+    return occurrence
+
+
+def random_intervals(rng: random.Random) -> str:
+    """Intervals string as accepted by /setintervals, both patterns."""
+    if rng.random() < 0.5:
+        if rng.random() < 0.1:
+            return "w:*"
+        return "w:" + ",".join(rng.sample(list(WEEKDAYS), rng.randint(1, 7)))
+    parts = ""
+    if rng.random() < 0.7:
+        parts += f"{rng.randint(10, 60)}m"
+    if rng.random() < 0.5:
+        parts += f"{rng.randint(1, 24)}h"
+    if rng.random() < 0.4:
+        parts += f"{rng.randint(1, 5)}d"
+    return "e" + (parts or "10m")
+
+
+def random_cases():
+    """
+    (intervals, current, after) triples: `after` before, at or long after current,
+    and exactly on a later occurrence, where "strictly after" matters.
+    """
+    rng = random.Random(SEED)
+    cases = []
+    for _ in range(CASES):
+        intervals = random_intervals(rng)
+        current = datetime(2024, 1, 1) + timedelta(minutes=rng.randint(0, 600_000))
+        roll = rng.random()
+        if roll < 0.1:
+            after = current
+        elif roll < 0.2:
+            after = current - timedelta(minutes=rng.randint(1, 3000))
+        elif roll < 0.4:
+            interval = Interval.parse(intervals)
+            period = timedelta(seconds=interval.period_seconds or 86400)
+            after = current + rng.randint(1, 50) * period
+        else:
+            after = current + timedelta(
+                minutes=rng.randint(1, 30_000), seconds=rng.randint(0, 59)
+            )
+        cases.append((intervals, current, after))
+    return cases
+
+
+def test_parse():
+    assert Interval.parse("e10m2h1d") == Interval(period_seconds=26 * 3600 + 600)
+    assert Interval.parse("w:mon,fri") == Interval(
+        weekday_mask=1 << WEEKDAYS["mon"] | 1 << WEEKDAYS["fri"]
+    )
+    assert Interval.parse("w:*") == Interval(weekday_mask=0b1111111)
+    for never in ("", None, "e", "e0m", "w:", "w:xyz"):
+        assert Interval.parse(never) is None
+
+
+def test_sql_occurrence_after_matches_stepping(db_connection):
+    """reminder_occurrence_after() on the compiled columns agrees with stepping."""
+    with db_connection.cursor() as cursor:
+        for intervals, current, after in random_cases():
+            interval = Interval.parse(intervals)
+            seconds, weekdays = interval.columns()
+            cursor.execute(
+                "SELECT reminder_occurrence_after(%s, %s, %s, %s)",
+                (current, seconds, weekdays, after),
+            )
+            assert cursor.fetchone()[0] == step_occurrence_after(
+                interval, current, after
+            ), (intervals, current, after)
+
+
+@pytest.mark.parametrize("intervals", ["", "e0m", "w:"])
+def test_sql_occurrence_after_without_recurrence(db_connection, intervals):
+    """One-time reminders have no next occurrence on the SQL side either."""
+    compiled = Interval.parse(intervals)
+    seconds, weekdays = compiled.columns() if compiled else (None, None)
+    with db_connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reminder_occurrence_after(%s, %s, %s, %s)",
+            (datetime(2024, 1, 1, 10), seconds, weekdays, datetime(2024, 2, 1)),
+        )
+        assert cursor.fetchone()[0] is None
@@ -0,0 +1,142 @@
+from datetime import date, datetime, time, timedelta, timezone
+import pytest
+import psycopg
+import src.database.PostgreSQLDB as psqldb
+import src.database.ReminderDAO as reminderdao
+
+USERS = 100
+REMINDERS_PER_USER = 1000
+# Reminders already due, enough that reading them in index order beats sorting them
+DUE = 2000
+# Negative ids never collide with the Discord users of the test database
+FIRST_USER_ID = -1_000_000
+PAGE_SIZE = 10
+SEEK_NAME = "reminder 500"
+
+# Edits as ReminderDAO._mutate_reminder runs them, all looked up by (user_id, r_name)
+EDITS = {
+    "set_time": (reminderdao._SET_TIME_SQL, {"time": time(9)}),
+    "set_date": (reminderdao._SET_DATE_SQL, {"date": date.today()}),
+    "set_name": (reminderdao._SET_NAME_SQL, {"new_name": "renamed"}),
+    "set_intervals": (
+        reminderdao._SET_INTERVALS_SQL,
+        {
+            "intervals": "e1d",
+            **reminderdao.ReminderDAO._interval_columns("e1d"),
+        },
+    ),
+    "delete": (reminderdao._DELETE_SQL, {}),
+    "toggle_status": (reminderdao._TOGGLE_STATUS_SQL, {}),
+}
+
+# Dashboard pages as ReminderDAO.get_reminders_page builds them: (after, before, last)
+PAGES = {
+    "first": (None, None, False),
+    "after": (SEEK_NAME, None, False),
+    "before": (None, SEEK_NAME, False),
+    "last": (None, None, True),
+}
+
+# ReminderDAO's hot statements and the index each one must be served by
+QUERY_PLANS = {
+    "claim_due": (
+        reminderdao._CLAIM_DUE_SQL,
+        {"worker_id": "worker", "lease": 60, "batch_size": 100},
+        "reminder_next_fire_idx",
+    ),
+    "fire_schedule": (
+        reminderdao._FIRE_SCHEDULE_SQL,
+        {
+            "before": datetime.now(timezone.utc) + timedelta(days=1),
+            "after": datetime.now(timezone.utc),
+            "worker_id": "worker",
+        },
+        "reminder_next_fire_idx",
+    ),
+    "next_lease_expiry": (
+        reminderdao._NEXT_LEASE_EXPIRY_SQL,
+        {"worker_id": "worker"},
+        "reminder_claim_expiry_idx",
+    ),
+    **{
+        f"edit_{edit}": (
+            reminderdao._MUTATE_REMINDER_SQL.format(statement=statement),
+            {"name": "reminder 42", **params},
+            "reminder_name_unique",
+        )
+        for edit, (statement, params) in EDITS.items()
+    },
+    **{
+        f"dashboard_{page}_{'filtered' if filtered else 'all'}": (
+            reminderdao._reminder_page_sql(
+                filtered, after is not None, before is not None, last
+            ),
+            {
+                "activity": False,
+                "after": after,
+                "before": before,
+                "page_size": PAGE_SIZE,
+            },
+            "reminder_user_activity_name_idx" if filtered else "reminder_name_unique",
+        )
+        for page, (after, before, last) in PAGES.items()
+        for filtered in (True, False)
+    },
+}
+
+
+def _index_scans(plan: dict):
+    """(node type, index name) of every index scan in an EXPLAIN (FORMAT JSON) plan tree."""
+    if plan["Node Type"] in ("Index Scan", "Index Only Scan"):
+        yield plan["Node Type"], plan["Index Name"]
+    for child in plan.get("Plans", []):
+        yield from _index_scans(child)
+
+
+@pytest.fixture(scope="module")
+def seeded_connection(migrated_database):
+    """
+    Reminder table with enough rows per user for the planner to prefer indexes:
+    active reminders firing one per minute from DUE minutes ago on, a tenth paused,
+    and a few leased to another worker.
+    Seeded once for the module in a transaction that is rolled back afterwards.
+    """
+    with psycopg.connect(**psqldb.CONNECTION_KWARGS) as connection:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO account (user_id)"
+                " SELECT %(first)s + u FROM generate_series(0, %(users)s - 1) AS u",
+                {"first": FIRST_USER_ID, "users": USERS},
+            )
+            cursor.execute(
+                "INSERT INTO reminder (user_id, r_name, r_message, r_time, r_date,"
+                " is_active, next_fire_at, claimed_by, claim_expires_at)"
+                " SELECT %(first)s + u, 'reminder ' || r, 'message', '08:00', CURRENT_DATE,"
+                " r %% 10 <> 0, now() + (u * %(per_user)s + r - %(due)s) * interval '1 minute',"
+                " CASE WHEN r = 0 THEN 'other' END,"
+                " CASE WHEN r = 0 THEN now() + interval '1 minute' END"
+                " FROM generate_series(0, %(users)s - 1) AS u,"
+                " generate_series(0, %(per_user)s - 1) AS r",
+                {
+                    "first": FIRST_USER_ID,
+                    "users": USERS,
+                    "per_user": REMINDERS_PER_USER,
+                    "due": DUE,
+                },
+            )
+            cursor.execute("ANALYZE account")
+            cursor.execute("ANALYZE reminder")
+        yield connection
+        connection.rollback()
+
+
+@pytest.mark.parametrize("statement", QUERY_PLANS)
+def test_hot_statements_use_their_index(seeded_connection, statement):
+    query, params, index = QUERY_PLANS[statement]
+    with seeded_connection.cursor() as cursor:
+        cursor.execute(
+            "EXPLAIN (FORMAT JSON) " + query,
+            {"user_id": FIRST_USER_ID + USERS // 2, **params},
+        )
+        plan = cursor.fetchone()[0][0]["Plan"]
+    assert index in {name for _, name in _index_scans(plan)}, plan